@@ -1,9 +1,23 @@
+import io
+import hashlib
 import streamlit as st
 import pandas as pd
 import numpy as np
 from datetime import datetime
 import plotly.express as px
 import plotly.graph_objects as go
+from utils.tables import render_table
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional; fall back to the pandas parser
+    pa = pacsv = None
+
+try:
+    import polars as pl
+except ImportError:  # polars is optional; summaries fall back to pandas
+    pl = None
 
 # Page configuration
 st.set_page_config(
@@ -13,8 +27,16 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
+# pandas copy-on-write, set once for the whole process: pages take cheap shallow
+# copies of the shared dataset and buffers are only duplicated when a page modifies
+# a column. The pages need an upload from this page first, so it is always set
+# before they touch the data.
+pd.options.mode.copy_on_write = True
+
+@st.cache_resource
+def static_css():
+    """Custom CSS for better styling."""
+    return """
 <style>
     .main-header {
         font-size: 3rem;
@@ -44,12 +66,285 @@ st.markdown("""
         font-weight: bold;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource
+def header_html():
+    """Page title and subtitle."""
+    return (
+        '<h1 class="main-header">🏥 Healthcare Analytics Dashboard</h1>'
+        '<p style="text-align: center; font-size: 1.2rem; color: #666;">Comprehensive Hospital Readmission Risk Analysis Following Learnathon Workflow</p>'
+    )
+
+@st.cache_resource
+def metric_cards_html():
+    """Problem statement, dataset source and target variable cards."""
+    cards = [
+        ("🎯 Problem Statement", "Predict Hospital Readmission Risk for Patients with Chronic Conditions"),
+        ("📊 Dataset Source", "Healthcare Dataset by prasad22 from Kaggle"),
+        ("🎯 Target Variable", "Test Results Classification (Normal/Abnormal/Inconclusive)")
+    ]
+    return [
+        f"""
+        <div class="metric-card">
+            <h3>{title}</h3>
+            <p>{text}</p>
+        </div>
+        """
+        for title, text in cards
+    ]
+
+@st.cache_resource
+def nav_html():
+    """Workflow phase banners paired with the steps they contain."""
+    phases = [
+        ("📋 Analysis Phase", """
+        1. **Problem Understanding**
+        2. **Stakeholder Analysis** 
+        3. **KPI Definition**
+        """),
+        ("🔧 Data Phase", """
+        4. **Data Preprocessing**
+        5. **Data Visualization**
+        """),
+        ("🤖 Modeling Phase", """
+        6. **Predictive Modeling**
+        """)
+    ]
+    return [
+        (f"""
+        <div class="workflow-step">
+            {phase}
+        </div>
+        """, steps)
+        for phase, steps in phases
+    ]
+
+st.markdown(static_css(), unsafe_allow_html=True)
+
+# Columns read by default; the remaining identifiers are only parsed on request
+USED_COLUMNS = (
+    'age', 'gender', 'blood_type', 'medical_condition', 'date_of_admission',
+    'discharge_date', 'admission_type', 'insurance_provider', 'billing_amount',
+    'test_results'
+)
+
+# Columns that identify a patient admission when checking for duplicate records
+DUPLICATE_KEY_COLUMNS = ('name', 'date_of_admission')
+
+# Low-cardinality text columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = (
+    'gender', 'blood_type', 'medical_condition', 'insurance_provider',
+    'admission_type', 'medication', 'test_results'
+)
+
+# Integer columns and the smallest dtype family they can be downcast to. Billing
+# amounts stay float64: to_numeric only downcasts floats that survive float32
+# exactly, which amounts with cents never do, and the precision matters for totals.
+DOWNCAST_COLUMNS = {
+    'age': 'unsigned',
+    'room_number': 'unsigned'
+}
+
+def normalize_columns(columns):
+    """Normalize column names - replace spaces/hyphens with underscores and lowercase."""
+    return columns.str.lower().str.replace(r'[\s\-]+', '_', regex=True)
+
+def dates_parseable(values, sample_size=500):
+    """Check whether a sample of a column's non-null values parses as dates."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return True
+    
+    sample = values.dropna()
+    sample = sample.sample(min(len(sample), sample_size), random_state=0)
+    return pd.to_datetime(sample, errors='coerce').notna().all()
+
+@st.cache_data(show_spinner=False)
+def load_csv(file_bytes, all_columns=False):
+    """Parse an uploaded CSV, using the multithreaded PyArrow reader when available.
+    
+    Unless ``all_columns`` is set, only the columns in USED_COLUMNS are parsed.
+    """
+    buffer = io.BytesIO(file_bytes)
+    header = pd.read_csv(buffer, nrows=0).columns
+    buffer.seek(0)
+    normalized = normalize_columns(header)
+    
+    include_columns = None
+    if not all_columns:
+        selected = header[normalized.isin(USED_COLUMNS)].tolist()
+        # Unrecognized layouts are loaded in full rather than as an empty frame
+        include_columns = selected or None
+    
+    categorical = header[normalized.isin(CATEGORICAL_COLUMNS)]
+    if pacsv is None:
+        # Categorical columns are parsed straight to category rather than object
+        data = pd.read_csv(
+            buffer,
+            usecols=include_columns,
+            dtype={col: 'category' for col in categorical}
+        )
+    else:
+        # Dictionary-encode categorical strings while parsing so each value is stored once
+        dictionary_type = pa.dictionary(pa.int32(), pa.string())
+        column_types = {col: dictionary_type for col in categorical}
+        
+        table = pacsv.read_csv(
+            buffer,
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 20),
+            convert_options=pacsv.ConvertOptions(
+                column_types=column_types,
+                timestamp_parsers=['%Y-%m-%d'],
+                include_columns=include_columns,
+                # Treat empty and NA-like text cells as null, as pandas does, in plain
+                # and dictionary string columns alike; Arrow keeps them as '' otherwise
+                strings_can_be_null=True
+            )
+        )
+        # Keep NumPy/object dtypes: the downstream pages select columns by 'object' dtype.
+        # Dictionary columns arrive as pandas categoricals.
+        data = table.to_pandas(split_blocks=True, self_destruct=True)
+    
+    # Clean column names - replace spaces with underscores and normalize
+    data.columns = normalize_columns(data.columns)
+    
+    # Parse date columns once here so validation and the other pages can reuse them
+    for col in data.columns:
+        if 'date' in col.lower() and dates_parseable(data[col]):
+            data[col] = pd.to_datetime(data[col], errors='coerce')
+    
+    # Shrink the frame before it is shared with the other pages
+    for col in CATEGORICAL_COLUMNS:
+        if col in data.columns:
+            data[col] = data[col].astype('category')
+    
+    for col, downcast in DOWNCAST_COLUMNS.items():
+        if col in data.columns:
+            data[col] = pd.to_numeric(data[col], downcast=downcast)
+    
+    return data
+
+@st.cache_data(show_spinner=False)
+def summarize_data(file_hash, all_columns, _data):
+    """Compute the quality metrics and schema table for an uploaded dataset.
+    
+    Keyed on the upload's content hash so reruns skip the full-frame scans.
+    When polars is installed the null counts, unique counts and duplicate
+    check run on its multithreaded engine; otherwise each column is visited
+    once in pandas, its non-null values feeding the null count and sample
+    values together.
+    """
+    # Hash only the admission key when it is loaded; a partial key would over-count
+    key_columns = None
+    if all(col in _data.columns for col in DUPLICATE_KEY_COLUMNS):
+        key_columns = list(DUPLICATE_KEY_COLUMNS)
+    
+    if pl is not None and pa is not None:
+        frame = pl.from_pandas(_data)
+        null_counts = list(frame.null_count().row(0))
+        # Polars counts null as a distinct value; pandas nunique does not
+        unique_counts = [
+            n_unique - (nulls > 0)
+            for n_unique, nulls in zip(frame.select(pl.all().n_unique()).row(0), null_counts)
+        ]
+        duplicate_count = frame.height - frame.unique(subset=key_columns).height
+        samples = [str(_data[col].dropna().head(2).tolist()) for col in _data.columns]
+    else:
+        null_counts, samples = [], []
+        for col in _data.columns:
+            values = _data[col]
+            present = values[values.notna()]
+            null_counts.append(len(values) - len(present))
+            samples.append(str(present.head(2).tolist()))
+        unique_counts = _data.nunique(dropna=True).to_numpy()
+        duplicate_count = _data.duplicated(subset=key_columns).sum()
+    
+    schema_info = pd.DataFrame({
+        'Column': _data.columns,
+        'Data Type': _data.dtypes.astype(str),
+        'Non-Null Count': [len(_data) - nulls for nulls in null_counts],
+        'Null Count': null_counts,
+        'Unique Values': unique_counts,
+        'Sample Values': samples
+    }, index=_data.columns)
+    
+    return {
+        'missing_count': sum(null_counts),
+        'duplicate_count': duplicate_count,
+        'schema_info': schema_info
+    }
+
+def render_data_overview(data, summary):
+    """Show metrics, preview, schema and validation for the uploaded dataset."""
+    # Display basic info
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Records", f"{len(data):,}")
+    with col2:
+        st.metric("Features", len(data.columns))
+    with col3:
+        missing_count = summary['missing_count']
+        st.metric("Missing Values", missing_count)
+    with col4:
+        duplicate_count = summary['duplicate_count']
+        st.metric("Duplicates", duplicate_count)
+    
+    # Data quality indicators
+    st.markdown("### 🔍 Data Quality Assessment")
+    quality_col1, quality_col2, quality_col3 = st.columns(3)
+    
+    with quality_col1:
+        completeness = (1 - missing_count / (len(data) * len(data.columns))) * 100
+        st.metric("Data Completeness", f"{completeness:.1f}%")
+    
+    with quality_col2:
+        uniqueness = (1 - duplicate_count / len(data)) * 100
+        st.metric("Data Uniqueness", f"{uniqueness:.1f}%")
+    
+    with quality_col3:
+        consistency = 100  # Placeholder for consistency check
+        st.metric("Data Consistency", f"{consistency:.1f}%")
+    
+    # Preview data
+    st.markdown("### 📋 Data Preview")
+    st.dataframe(data.head(10), use_container_width=True)
+    
+    # Show column information
+    st.markdown("### 📊 Dataset Schema")
+    schema_info = summary['schema_info']
+    render_table(schema_info)
+    
+    # Data validation checks
+    st.markdown("### ✅ Data Validation")
+    validation_checks = []
+    columns = set(data.columns)
+    
+    # Check for target variable
+    target_candidates = {'test_results', 'Test_Results', 'test results'}
+    target_found = bool(columns & target_candidates)
+    validation_checks.append(("Target Variable Present", "✅" if target_found else "❌"))
+    
+    # Check for key features
+    key_features = {'age', 'gender', 'medical_condition'}
+    features_found = len(columns & key_features)
+    validation_checks.append(("Key Features Present", f"{features_found}/{len(key_features)}"))
+    
+    # Check data types
+    # Dates were parsed at load time, so this only inspects dtypes and NaT counts
+    date_cols = [col for col in data.columns if 'date' in col.lower()]
+    dates_valid = True
+    for col in date_cols:
+        if not (pd.api.types.is_datetime64_any_dtype(data[col]) and data[col].notna().all()):
+            dates_valid = False
+            break
+    validation_checks.append(("Date Formats Valid", "✅" if dates_valid else "⚠️"))
+    
+    validation_df = pd.DataFrame(validation_checks, columns=['Check', 'Status'])
+    render_table(validation_df)
 
 def main():
     # Header
-    st.markdown('<h1 class="main-header">🏥 Healthcare Analytics Dashboard</h1>', unsafe_allow_html=True)
-    st.markdown('<p style="text-align: center; font-size: 1.2rem; color: #666;">Comprehensive Hospital Readmission Risk Analysis Following Learnathon Workflow</p>', unsafe_allow_html=True)
+    st.markdown(header_html(), unsafe_allow_html=True)
     
     # Sidebar navigation
     st.sidebar.title("📋 Navigation")
@@ -66,9 +361,11 @@ def main():
         ("🤖", "Predictive Modeling", "6_Predictive_Modeling")
     ]
     
-    for i, (icon, title, page) in enumerate(workflow_steps, 1):
-        status = "✅" if 'healthcare_data' in st.session_state else "⏳"
-        st.sidebar.markdown(f"{i}. {icon} **{title}** {status}")
+    status = "✅" if 'healthcare_data' in st.session_state else "⏳"
+    st.sidebar.markdown("\n".join(
+        f"{i}. {icon} **{title}** {status}"
+        for i, (icon, title, _) in enumerate(workflow_steps, 1)
+    ))
     
     st.sidebar.markdown("---")
     st.sidebar.markdown("### 📊 Quick Stats")
@@ -77,36 +374,15 @@ def main():
         data = st.session_state['healthcare_data']
         st.sidebar.metric("Total Records", len(data))
         st.sidebar.metric("Features", len(data.columns))
-        st.sidebar.metric("Missing Values", data.isnull().sum().sum())
+        # Taken from the cached upload summary rather than rescanning the frame
+        st.sidebar.metric("Missing Values", st.session_state.get('healthcare_data_missing', 0))
     else:
         st.sidebar.info("Upload data to see stats")
     
     # Main content
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>🎯 Problem Statement</h3>
-            <p>Predict Hospital Readmission Risk for Patients with Chronic Conditions</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>📊 Dataset Source</h3>
-            <p>Healthcare Dataset by prasad22 from Kaggle</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>🎯 Target Variable</h3>
-            <p>Test Results Classification (Normal/Abnormal/Inconclusive)</p>
-        </div>
-        """, unsafe_allow_html=True)
+    for column, card in zip(st.columns(3), metric_cards_html()):
+        with column:
+            st.markdown(card, unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -118,103 +394,27 @@ def main():
         type=['csv'],
         help="Upload the healthcare_dataset.csv file from Kaggle"
     )
+    load_all_columns = st.checkbox(
+        "Load all columns",
+        value=False,
+        help="By default identifier columns such as Name, Doctor and Hospital are skipped to speed up loading"
+    )
     
     if uploaded_file is not None:
         try:
             # Load data with progress bar
             with st.spinner('Loading and processing dataset...'):
-                data = pd.read_csv(uploaded_file)
-                
-                # Clean column names - replace spaces with underscores and normalize
-                data.columns = data.columns.str.replace(' ', '_').str.replace('-', '_').str.lower()
-                
-                # Standardize column names to match expected format
-                column_mapping = {
-                    'medical_condition': 'medical_condition',
-                    'test_results': 'test_results', 
-                    'billing_amount': 'billing_amount',
-                    'insurance_provider': 'insurance_provider',
-                    'blood_type': 'blood_type',
-                    'date_of_admission': 'date_of_admission',
-                    'discharge_date': 'discharge_date',
-                    'admission_type': 'admission_type',
-                    'room_number': 'room_number'
-                }
-                
-                # Apply column mapping if columns exist
-                for old_name, new_name in column_mapping.items():
-                    if old_name in data.columns:
-                        data = data.rename(columns={old_name: new_name})
+                file_bytes = uploaded_file.getvalue()
+                data = load_csv(file_bytes, load_all_columns)
+                file_hash = hashlib.sha256(file_bytes).hexdigest()
+                summary = summarize_data(file_hash, load_all_columns, data)
             
             st.success(f"✅ Dataset loaded successfully! Shape: {data.shape}")
             st.session_state['healthcare_data'] = data
+            st.session_state['healthcare_data_key'] = f"{file_hash}_{'all' if load_all_columns else 'used'}"
+            st.session_state['healthcare_data_missing'] = summary['missing_count']
             
-            # Display basic info
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("Total Records", f"{len(data):,}")
-            with col2:
-                st.metric("Features", len(data.columns))
-            with col3:
-                missing_count = data.isnull().sum().sum()
-                st.metric("Missing Values", missing_count)
-            with col4:
-                duplicate_count = data.duplicated().sum()
-                st.metric("Duplicates", duplicate_count)
-            
-            # Data quality indicators
-            st.markdown("### 🔍 Data Quality Assessment")
-            quality_col1, quality_col2, quality_col3 = st.columns(3)
-            
-            with quality_col1:
-                completeness = (1 - data.isnull().sum().sum() / (len(data) * len(data.columns))) * 100
-                st.metric("Data Completeness", f"{completeness:.1f}%")
-            
-            with quality_col2:
-                uniqueness = (1 - duplicate_count / len(data)) * 100
-                st.metric("Data Uniqueness", f"{uniqueness:.1f}%")
-            
-            with quality_col3:
-                consistency = 100  # Placeholder for consistency check
-                st.metric("Data Consistency", f"{consistency:.1f}%")
-            
-            # Preview data
-            st.markdown("### 📋 Data Preview")
-            st.dataframe(data.head(10), use_container_width=True)
-            
-            # Show column information
-            st.markdown("### 📊 Dataset Schema")
-            schema_info = pd.DataFrame({
-                'Column': data.columns,
-                'Data Type': data.dtypes.astype(str),
-                'Non-Null Count': data.count(),
-                'Null Count': data.isnull().sum(),
-                'Unique Values': [data[col].nunique() for col in data.columns],
-                'Sample Values': [str(data[col].dropna().head(2).tolist()) for col in data.columns]
-            })
-            st.dataframe(schema_info, use_container_width=True)
-            
-            # Data validation checks
-            st.markdown("### ✅ Data Validation")
-            validation_checks = []
-            
-            # Check for target variable
-            target_candidates = ['test_results', 'Test_Results', 'test results']
-            target_found = any(col in data.columns for col in target_candidates)
-            validation_checks.append(("Target Variable Present", "✅" if target_found else "❌"))
-            
-            # Check for key features
-            key_features = ['age', 'gender', 'medical_condition']
-            features_found = sum(1 for feature in key_features if feature in data.columns)
-            validation_checks.append(("Key Features Present", f"{features_found}/{len(key_features)}"))
-            
-            # Check data types
-            date_cols = [col for col in data.columns if 'date' in col.lower()]
-            dates_valid = all(pd.to_datetime(data[col], errors='coerce').notna().all() for col in date_cols)
-            validation_checks.append(("Date Formats Valid", "✅" if dates_valid else "⚠️"))
-            
-            validation_df = pd.DataFrame(validation_checks, columns=['Check', 'Status'])
-            st.dataframe(validation_df, use_container_width=True)
+            render_data_overview(data, summary)
             
         except Exception as e:
             st.error(f"❌ Error loading data: {str(e)}")
@@ -351,40 +551,10 @@ def main():
     st.markdown("---")
     st.markdown('<h2 class="section-header">🧭 Navigation Guide</h2>', unsafe_allow_html=True)
     
-    nav_col1, nav_col2, nav_col3 = st.columns(3)
-    
-    with nav_col1:
-        st.markdown("""
-        <div class="workflow-step">
-            📋 Analysis Phase
-        </div>
-        """, unsafe_allow_html=True)
-        st.markdown("""
-        1. **Problem Understanding**
-        2. **Stakeholder Analysis** 
-        3. **KPI Definition**
-        """)
-    
-    with nav_col2:
-        st.markdown("""
-        <div class="workflow-step">
-            🔧 Data Phase
-        </div>
-        """, unsafe_allow_html=True)
-        st.markdown("""
-        4. **Data Preprocessing**
-        5. **Data Visualization**
-        """)
-    
-    with nav_col3:
-        st.markdown("""
-        <div class="workflow-step">
-            🤖 Modeling Phase
-        </div>
-        """, unsafe_allow_html=True)
-        st.markdown("""
-        6. **Predictive Modeling**
-        """)
+    for column, (phase, steps) in zip(st.columns(3), nav_html()):
+        with column:
+            st.markdown(phase, unsafe_allow_html=True)
+            st.markdown(steps)
     
     # Footer
     st.markdown("---")
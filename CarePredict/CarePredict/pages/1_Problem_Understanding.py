@@ -2,9 +2,112 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+from utils.tables import render_table
 
 st.set_page_config(page_title="Problem Understanding", page_icon="🎯", layout="wide")
 
+@st.cache_resource
+def classification_figure():
+    """Static bar chart of the three test result categories."""
+    classes = ['Normal', 'Abnormal', 'Inconclusive']
+    challenges = ['Clear Diagnosis', 'Requires Immediate Action', 'Needs Further Testing']
+    colors = ['#2ecc71', '#e74c3c', '#f39c12']
+    
+    fig = go.Figure(go.Bar(
+        x=classes,
+        y=[1, 1, 1],
+        marker_color=colors,
+        text=challenges,
+        textposition='inside'
+    ))
+    fig.update_layout(
+        title="Test Result Classification Categories",
+        xaxis_title="Test Result Categories",
+        yaxis_title="Classification Complexity",
+        showlegend=False
+    )
+    return fig
+
+@st.cache_resource
+def dataset_info_table():
+    """Attribute/value summary of the Kaggle healthcare dataset."""
+    dataset_info = {
+        "Dataset Name": "Healthcare Dataset",
+        "Source": "Kaggle - prasad22",
+        "Records": "10,000 synthetic patient records",
+        "Purpose": "Multi-category classification problem",
+        "Target Variable": "Test Results (Normal/Abnormal/Inconclusive)",
+        "Data Type": "Synthetic healthcare data"
+    }
+    
+    return pd.DataFrame(list(dataset_info.items()), columns=['Attribute', 'Value'])
+
+@st.cache_resource
+def schema_table():
+    """Column names, types and descriptions of the dataset."""
+    schema_data = {
+        "Column Name": [
+            "Name", "Age", "Gender", "Blood Type", "Medical Condition",
+            "Date of Admission", "Doctor", "Hospital", "Insurance Provider",
+            "Billing Amount", "Room Number", "Admission Type", "Discharge Date",
+            "Medication", "Test Results"
+        ],
+        "Data Type": [
+            "Text", "Integer", "Categorical", "Categorical", "Categorical",
+            "Date", "Text", "Categorical", "Categorical",
+            "Float", "Integer", "Categorical", "Date",
+            "Categorical", "Categorical"
+        ],
+        "Description": [
+            "Patient name identifier",
+            "Patient age in years",
+            "Patient gender (Male/Female)",
+            "Blood type (A+, B-, O+, etc.)",
+            "Primary medical condition",
+            "Hospital admission date",
+            "Attending physician name",
+            "Healthcare facility name",
+            "Insurance provider name",
+            "Total billing amount",
+            "Assigned room number",
+            "Type of admission (Emergency/Elective/Urgent)",
+            "Hospital discharge date",
+            "Prescribed medication",
+            "Medical test results (Target variable)"
+        ]
+    }
+    
+    return pd.DataFrame(schema_data)
+
+@st.cache_resource
+def challenges_table():
+    """Expected modeling challenges and their mitigation strategies."""
+    challenges_data = {
+        "Challenge": [
+            "Class Imbalance",
+            "Feature Selection",
+            "Model Interpretability",
+            "Overfitting",
+            "Data Quality"
+        ],
+        "Description": [
+            "Uneven distribution of test results",
+            "Identifying most predictive features",
+            "Making models explainable to clinicians",
+            "Model performs well on training but not test data",
+            "Missing values and inconsistent data"
+        ],
+        "Mitigation Strategy": [
+            "Use SMOTE, class weights, or stratified sampling",
+            "Use feature importance scores and domain knowledge",
+            "Use SHAP values and feature importance plots",
+            "Use cross-validation and regularization",
+            "Implement comprehensive data cleaning pipeline"
+        ]
+    }
+    
+    return pd.DataFrame(challenges_data)
+
 st.title("🎯 Problem Understanding")
 st.markdown("---")
 
@@ -54,54 +157,11 @@ st.header("📊 Dataset Overview")
 
 # Display dataset information
 st.subheader("📋 Healthcare Dataset Information")
-dataset_info = {
-    "Dataset Name": "Healthcare Dataset",
-    "Source": "Kaggle - prasad22",
-    "Records": "10,000 synthetic patient records",
-    "Purpose": "Multi-category classification problem",
-    "Target Variable": "Test Results (Normal/Abnormal/Inconclusive)",
-    "Data Type": "Synthetic healthcare data"
-}
-
-info_df = pd.DataFrame(list(dataset_info.items()), columns=['Attribute', 'Value'])
-st.table(info_df)
+render_table(dataset_info_table())
 
 # Data Schema
 st.subheader("🗂️ Data Schema")
-schema_data = {
-    "Column Name": [
-        "Name", "Age", "Gender", "Blood Type", "Medical Condition",
-        "Date of Admission", "Doctor", "Hospital", "Insurance Provider",
-        "Billing Amount", "Room Number", "Admission Type", "Discharge Date",
-        "Medication", "Test Results"
-    ],
-    "Data Type": [
-        "Text", "Integer", "Categorical", "Categorical", "Categorical",
-        "Date", "Text", "Categorical", "Categorical",
-        "Float", "Integer", "Categorical", "Date",
-        "Categorical", "Categorical"
-    ],
-    "Description": [
-        "Patient name identifier",
-        "Patient age in years",
-        "Patient gender (Male/Female)",
-        "Blood type (A+, B-, O+, etc.)",
-        "Primary medical condition",
-        "Hospital admission date",
-        "Attending physician name",
-        "Healthcare facility name",
-        "Insurance provider name",
-        "Total billing amount",
-        "Assigned room number",
-        "Type of admission (Emergency/Elective/Urgent)",
-        "Hospital discharge date",
-        "Prescribed medication",
-        "Medical test results (Target variable)"
-    ]
-}
-
-schema_df = pd.DataFrame(schema_data)
-st.dataframe(schema_df, use_container_width=True)
+render_table(schema_table())
 
 # Problem Complexity Analysis
 st.header("🧩 Problem Complexity Analysis")
@@ -124,24 +184,7 @@ with complexity_tabs[0]:
     """)
     
     # Visualization of classification challenge
-    classes = ['Normal', 'Abnormal', 'Inconclusive']
-    challenges = ['Clear Diagnosis', 'Requires Immediate Action', 'Needs Further Testing']
-    colors = ['#2ecc71', '#e74c3c', '#f39c12']
-    
-    fig = go.Figure(go.Bar(
-        x=classes,
-        y=[1, 1, 1],
-        marker_color=colors,
-        text=challenges,
-        textposition='inside'
-    ))
-    fig.update_layout(
-        title="Test Result Classification Categories",
-        xaxis_title="Test Result Categories",
-        yaxis_title="Classification Complexity",
-        showlegend=False
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(classification_figure(), use_container_width=True)
 
 with complexity_tabs[1]:
     st.subheader("Data-Related Challenges")
@@ -221,8 +264,9 @@ research_questions = [
     "What interventions could be recommended based on predictions?"
 ]
 
-for i, question in enumerate(research_questions, 1):
-    st.markdown(f"**{i}.** {question}")
+st.markdown("\n\n".join(
+    f"**{i}.** {question}" for i, question in enumerate(research_questions, 1)
+))
 
 # Methodology Overview
 st.header("🔬 Methodology Overview")
@@ -250,32 +294,7 @@ with method_col2:
 # Expected Challenges
 st.header("⚠️ Expected Challenges & Mitigation")
 
-challenges_data = {
-    "Challenge": [
-        "Class Imbalance",
-        "Feature Selection",
-        "Model Interpretability",
-        "Overfitting",
-        "Data Quality"
-    ],
-    "Description": [
-        "Uneven distribution of test results",
-        "Identifying most predictive features",
-        "Making models explainable to clinicians",
-        "Model performs well on training but not test data",
-        "Missing values and inconsistent data"
-    ],
-    "Mitigation Strategy": [
-        "Use SMOTE, class weights, or stratified sampling",
-        "Use feature importance scores and domain knowledge",
-        "Use SHAP values and feature importance plots",
-        "Use cross-validation and regularization",
-        "Implement comprehensive data cleaning pipeline"
-    ]
-}
-
-challenges_df = pd.DataFrame(challenges_data)
-st.dataframe(challenges_df, use_container_width=True)
+render_table(challenges_table())
 
 # Next Steps
 st.header("🚀 Next Steps")
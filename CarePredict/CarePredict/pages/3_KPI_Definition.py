@@ -1,575 +1,322 @@
+from types import MappingProxyType
+
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import numpy as np
+from utils.tables import render_table
+
+try:
+    import kaleido  # noqa: F401 - backs Figure.to_image
+except ImportError:  # kaleido is optional; the trend chart falls back to the HTML embed
+    kaleido = None
 
 st.set_page_config(page_title="KPI Definition", page_icon="📊", layout="wide")
 
-st.title("📊 Key Performance Indicators (KPI) Definition")
-st.markdown("---")
+# The trend and prioritization charts only use cartesian traces
+PLOTLY_BASIC_JS = "https://cdn.plot.ly/plotly-basic-{version}.min.js"
 
-st.markdown("""
-Defining clear, measurable KPIs is essential for tracking the success of our healthcare analytics project. 
-These indicators will help us measure progress toward reducing hospital readmissions and improving patient outcomes.
-""")
-
-# KPI Categories
-st.header("🎯 KPI Categories")
-
-kpi_tabs = st.tabs(["🏥 Clinical KPIs", "💰 Financial KPIs", "⚡ Operational KPIs", "🤖 Model Performance KPIs"])
+# Trend months as plain labels, so Plotly treats them as categories and never
+# serializes datetimes (same values as pd.date_range('2024-01-01', periods=12, freq='M'))
+TREND_MONTHS = (
+    "2024-01", "2024-02", "2024-03", "2024-04", "2024-05", "2024-06",
+    "2024-07", "2024-08", "2024-09", "2024-10", "2024-11", "2024-12"
+)
 
-with kpi_tabs[0]:
-    st.subheader("Clinical Performance Indicators")
-    
-    clinical_kpis = {
-        "KPI Name": [
-            "30-Day Readmission Rate",
-            "Patient Mortality Rate", 
-            "Length of Stay (LOS)",
-            "Test Result Accuracy",
-            "Treatment Success Rate"
-        ],
-        "Definition": [
-            "Percentage of patients readmitted within 30 days",
-            "Percentage of patients who die during or after treatment",
-            "Average number of days patients stay in hospital",
-            "Percentage of correctly classified test results",
-            "Percentage of patients with improved health outcomes"
-        ],
-        "Target Value": [
-            "<10%",
-            "<2%",
-            "5-7 days",
-            ">90%",
-            ">85%"
-        ],
-        "Current Baseline": [
-            "15%",
-            "3%",
-            "8 days",
-            "Unknown",
-            "Unknown"
-        ]
-    }
-    
-    clinical_df = pd.DataFrame(clinical_kpis)
-    st.dataframe(clinical_df, use_container_width=True)
-    
-    # Clinical KPI Visualization
-    fig = go.Figure()
-    
-    kpi_names = clinical_kpis["KPI Name"]
-    current_values = [15, 3, 8, 70, 70]  # Sample current values
-    target_values = [10, 2, 6, 90, 85]   # Target values
-    
-    fig.add_trace(go.Bar(
-        name='Current Performance',
-        x=kpi_names,
-        y=current_values,
-        marker_color='lightcoral'
-    ))
-    
-    fig.add_trace(go.Bar(
-        name='Target Performance',
-        x=kpi_names,
-        y=target_values,
-        marker_color='lightgreen'
-    ))
-    
-    fig.update_layout(
-        title='Clinical KPIs: Current vs Target Performance',
-        xaxis_title='KPI',
-        yaxis_title='Value (%)',
-        barmode='group'
+# Sample chart values as compact typed arrays, which Plotly ships base64-encoded
+CLINICAL_CURRENT = np.array([15, 3, 8, 70, 70], dtype=np.int8)
+CLINICAL_TARGET = np.array([10, 2, 6, 90, 85], dtype=np.int8)
+FINANCIAL_IMPACT = np.array([4, 3, 4, 5, 4], dtype=np.int8)  # Impact scores (1-5)
+MODEL_CURRENT = np.array([75, 70, 78, 74, 82], dtype=np.int8)
+MODEL_TARGET = np.array([85, 80, 80, 80, 85], dtype=np.int8)
+TREND_READMISSION = np.array([15.2, 14.8, 14.1, 13.7, 13.2, 12.9, 12.5, 12.1, 11.8, 11.4, 11.1, 10.8], dtype=np.float32)
+TREND_ACCURACY = np.array([82.1, 83.5, 84.2, 85.1, 85.8, 86.3, 86.9, 87.2, 87.6, 87.9, 88.1, 88.4], dtype=np.float32)
+
+# Reference charts are documentation only; no zoom, pan or hover handlers
+STATIC_CHART_CONFIG = {'staticPlot': True}
+
+# KPI category definitions; read-only views so no page code can mutate them
+CLINICAL_KPIS = MappingProxyType({
+    "KPI Name": (
+        "30-Day Readmission Rate",
+        "Patient Mortality Rate", 
+        "Length of Stay (LOS)",
+        "Test Result Accuracy",
+        "Treatment Success Rate"
+    ),
+    "Definition": (
+        "Percentage of patients readmitted within 30 days",
+        "Percentage of patients who die during or after treatment",
+        "Average number of days patients stay in hospital",
+        "Percentage of correctly classified test results",
+        "Percentage of patients with improved health outcomes"
+    ),
+    "Target Value": (
+        "<10%",
+        "<2%",
+        "5-7 days",
+        ">90%",
+        ">85%"
+    ),
+    "Current Baseline": (
+        "15%",
+        "3%",
+        "8 days",
+        "Unknown",
+        "Unknown"
     )
-    
-    st.plotly_chart(fig, use_container_width=True)
-
-with kpi_tabs[1]:
-    st.subheader("Financial Performance Indicators")
-    
-    financial_kpis = {
-        "KPI Name": [
-            "Cost per Readmission",
-            "Average Billing Amount",
-            "Insurance Claim Approval Rate",
-            "Cost Savings from Prevention",
-            "Revenue per Patient"
-        ],
-        "Definition": [
-            "Average cost incurred per readmitted patient",
-            "Mean billing amount per patient admission",
-            "Percentage of insurance claims approved",
-            "Money saved by preventing readmissions",
-            "Average revenue generated per patient"
-        ],
-        "Target Value": [
-            "<$15,000",
-            "$20,000-$30,000",
-            ">95%",
-            ">$500,000/year",
-            ">$25,000"
-        ],
-        "Impact": [
-            "High",
-            "Medium",
-            "High",
-            "Very High",
-            "High"
-        ]
-    }
-    
-    financial_df = pd.DataFrame(financial_kpis)
-    st.dataframe(financial_df, use_container_width=True)
-    
-    # Financial Impact Visualization
-    categories = financial_kpis["KPI Name"]
-    impact_values = [4, 3, 4, 5, 4]  # Impact scores
-    
-    fig = px.bar(
-        x=categories,
-        y=impact_values,
-        title="Financial KPIs - Impact Assessment",
-        color=impact_values,
-        color_continuous_scale="RdYlGn",
-        labels={'y': 'Impact Score (1-5)', 'x': 'Financial KPI'}
+})
+
+FINANCIAL_KPIS = MappingProxyType({
+    "KPI Name": (
+        "Cost per Readmission",
+        "Average Billing Amount",
+        "Insurance Claim Approval Rate",
+        "Cost Savings from Prevention",
+        "Revenue per Patient"
+    ),
+    "Definition": (
+        "Average cost incurred per readmitted patient",
+        "Mean billing amount per patient admission",
+        "Percentage of insurance claims approved",
+        "Money saved by preventing readmissions",
+        "Average revenue generated per patient"
+    ),
+    "Target Value": (
+        "<$15,000",
+        "$20,000-$30,000",
+        ">95%",
+        ">$500,000/year",
+        ">$25,000"
+    ),
+    "Impact": (
+        "High",
+        "Medium",
+        "High",
+        "Very High",
+        "High"
     )
-    
-    st.plotly_chart(fig, use_container_width=True)
-
-with kpi_tabs[2]:
-    st.subheader("Operational Performance Indicators")
-    
-    operational_kpis = {
-        "KPI Name": [
-            "Bed Utilization Rate",
-            "Emergency Department Visits",
-            "Staff Efficiency Score",
-            "Patient Satisfaction Score",
-            "System Response Time"
-        ],
-        "Definition": [
-            "Percentage of available beds occupied",
-            "Number of emergency visits per month",
-            "Measure of staff productivity and effectiveness",
-            "Patient-reported satisfaction rating",
-            "Time for system to provide risk predictions"
-        ],
-        "Target Value": [
-            "80-90%",
-            "Reduce by 20%",
-            ">4.0/5.0",
-            ">4.5/5.0",
-            "<2 seconds"
-        ],
-        "Measurement Frequency": [
-            "Daily",
-            "Monthly",
-            "Quarterly",
-            "Monthly",
-            "Real-time"
-        ]
-    }
-    
-    operational_df = pd.DataFrame(operational_kpis)
-    st.dataframe(operational_df, use_container_width=True)
-
-with kpi_tabs[3]:
-    st.subheader("Model Performance Indicators")
-    
-    model_kpis = {
-        "KPI Name": [
-            "Model Accuracy",
-            "Precision (Positive Predictive Value)",
-            "Recall (Sensitivity)",
-            "F1-Score",
-            "AUC-ROC Score",
-            "False Positive Rate",
-            "Model Reliability Score"
-        ],
-        "Definition": [
-            "Percentage of correct predictions",
-            "True positives / (True positives + False positives)",
-            "True positives / (True positives + False negatives)",
-            "Harmonic mean of precision and recall",
-            "Area under ROC curve",
-            "False positives / (False positives + True negatives)",
-            "Consistency of model predictions over time"
-        ],
-        "Target Value": [
-            ">85%",
-            ">80%",
-            ">80%",
-            ">80%",
-            ">0.85",
-            "<10%",
-            ">90%"
-        ],
-        "Critical Level": [
-            "<70%",
-            "<60%",
-            "<60%",
-            "<60%",
-            "<0.70",
-            ">20%",
-            "<70%"
-        ]
-    }
-    
-    model_df = pd.DataFrame(model_kpis)
-    st.dataframe(model_df, use_container_width=True)
-    
-    # Model Performance Radar Chart
-    categories = ['Accuracy', 'Precision', 'Recall', 'F1-Score', 'AUC-ROC']
-    target_values = [85, 80, 80, 80, 85]
-    current_values = [75, 70, 78, 74, 82]  # Sample current performance
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatterpolar(
-        r=target_values,
-        theta=categories,
-        fill='toself',
-        name='Target Performance',
-        line_color='green'
-    ))
-    
-    fig.add_trace(go.Scatterpolar(
-        r=current_values,
-        theta=categories,
-        fill='toself',
-        name='Current Performance',
-        line_color='orange'
-    ))
-    
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 100]
-            )),
-        showlegend=True,
-        title="Model Performance KPIs: Current vs Target"
+})
+
+OPERATIONAL_KPIS = MappingProxyType({
+    "KPI Name": (
+        "Bed Utilization Rate",
+        "Emergency Department Visits",
+        "Staff Efficiency Score",
+        "Patient Satisfaction Score",
+        "System Response Time"
+    ),
+    "Definition": (
+        "Percentage of available beds occupied",
+        "Number of emergency visits per month",
+        "Measure of staff productivity and effectiveness",
+        "Patient-reported satisfaction rating",
+        "Time for system to provide risk predictions"
+    ),
+    "Target Value": (
+        "80-90%",
+        "Reduce by 20%",
+        ">4.0/5.0",
+        ">4.5/5.0",
+        "<2 seconds"
+    ),
+    "Measurement Frequency": (
+        "Daily",
+        "Monthly",
+        "Quarterly",
+        "Monthly",
+        "Real-time"
     )
-    
-    st.plotly_chart(fig, use_container_width=True)
-
-# KPI Dashboard Design
-st.header("📈 KPI Dashboard Design")
-
-st.subheader("🎛️ Real-time KPI Monitoring")
+})
+
+MODEL_KPIS = MappingProxyType({
+    "KPI Name": (
+        "Model Accuracy",
+        "Precision (Positive Predictive Value)",
+        "Recall (Sensitivity)",
+        "F1-Score",
+        "AUC-ROC Score",
+        "False Positive Rate",
+        "Model Reliability Score"
+    ),
+    "Definition": (
+        "Percentage of correct predictions",
+        "True positives / (True positives + False positives)",
+        "True positives / (True positives + False negatives)",
+        "Harmonic mean of precision and recall",
+        "Area under ROC curve",
+        "False positives / (False positives + True negatives)",
+        "Consistency of model predictions over time"
+    ),
+    "Target Value": (
+        ">85%",
+        ">80%",
+        ">80%",
+        ">80%",
+        ">0.85",
+        "<10%",
+        ">90%"
+    ),
+    "Critical Level": (
+        "<70%",
+        "<60%",
+        "<60%",
+        "<60%",
+        "<0.70",
+        ">20%",
+        "<70%"
+    )
+})
 
-# Create sample dashboard layout
-col1, col2, col3, col4 = st.columns(4)
+# Action plans toggle client-side through native <details> elements
+ACTION_PLANS_HTML = """
+<details open>
+<summary>🏥 Clinical Improvements</summary>
 
-with col1:
-    st.metric(
-        label="30-Day Readmission Rate",
-        value="12.3%",
-        delta="-2.7%",
-        delta_color="inverse"
-    )
+#### Clinical KPI Improvement Actions
 
-with col2:
-    st.metric(
-        label="Model Accuracy",
-        value="87.2%",
-        delta="+4.1%"
-    )
+**For 30-Day Readmission Rate Reduction:**
+- Implement post-discharge follow-up protocols
+- Enhanced patient education programs
+- Medication reconciliation improvements
+- Chronic disease management programs
 
-with col3:
-    st.metric(
-        label="Cost Savings (Monthly)",
-        value="$425K",
-        delta="+$75K"
-    )
+**For Treatment Success Rate Improvement:**
+- Evidence-based treatment protocols
+- Personalized care plans
+- Multidisciplinary team approaches
+- Continuous clinical training
 
-with col4:
-    st.metric(
-        label="Patient Satisfaction",
-        value="4.6/5.0",
-        delta="+0.3"
-    )
+</details>
 
-# KPI Trend Analysis
-st.subheader("📊 KPI Trend Analysis")
-
-# Sample trend data
-dates = pd.date_range('2024-01-01', periods=12, freq='M')
-readmission_rates = [15.2, 14.8, 14.1, 13.7, 13.2, 12.9, 12.5, 12.1, 11.8, 11.4, 11.1, 10.8]
-model_accuracy = [82.1, 83.5, 84.2, 85.1, 85.8, 86.3, 86.9, 87.2, 87.6, 87.9, 88.1, 88.4]
-
-fig = go.Figure()
-
-fig.add_trace(go.Scatter(
-    x=dates,
-    y=readmission_rates,
-    mode='lines+markers',
-    name='Readmission Rate (%)',
-    line=dict(color='red'),
-    yaxis='y'
-))
-
-fig.add_trace(go.Scatter(
-    x=dates,
-    y=model_accuracy,
-    mode='lines+markers',
-    name='Model Accuracy (%)',
-    line=dict(color='blue'),
-    yaxis='y2'
-))
-
-fig.update_layout(
-    title='KPI Trends Over Time',
-    xaxis_title='Month',
-    yaxis=dict(
-        title='Readmission Rate (%)',
-        side='left',
-        range=[10, 16]
-    ),
-    yaxis2=dict(
-        title='Model Accuracy (%)',
-        side='right',
-        overlaying='y',
-        range=[80, 90]
-    ),
-    hovermode='x unified'
-)
+<details>
+<summary>💰 Financial Optimizations</summary>
 
-st.plotly_chart(fig, use_container_width=True)
+#### Financial KPI Optimization Actions
 
-# KPI Prioritization Matrix
-st.header("🎯 KPI Prioritization Matrix")
+**For Cost per Readmission Reduction:**
+- Preventive care investments
+- Efficient resource allocation
+- Value-based care contracts
+- Technology automation
 
-st.markdown("""
-We prioritize KPIs based on their impact on patient outcomes and business value, 
-as well as the feasibility of measurement and improvement.
-""")
+**For Revenue per Patient Optimization:**
+- Service line expansion
+- Quality-based reimbursements
+- Insurance negotiation improvements
+- Billing process optimization
 
-# KPI Priority Data
-kpi_priority_data = {
-    "KPI": [
-        "30-Day Readmission Rate", "Model Accuracy", "Patient Satisfaction",
-        "Cost per Readmission", "Treatment Success Rate", "Length of Stay",
-        "System Response Time", "Staff Efficiency"
-    ],
-    "Impact": [9, 8, 8, 7, 9, 6, 5, 6],
-    "Feasibility": [8, 9, 7, 8, 6, 8, 9, 7],
-    "Priority Score": [17, 17, 15, 15, 15, 14, 14, 13]
-}
+</details>
 
-# Create priority matrix
-fig = px.scatter(
-    x=kpi_priority_data["Feasibility"],
-    y=kpi_priority_data["Impact"],
-    text=kpi_priority_data["KPI"],
-    size=kpi_priority_data["Priority Score"],
-    color=kpi_priority_data["Priority Score"],
-    color_continuous_scale="viridis",
-    title="KPI Prioritization Matrix: Impact vs Feasibility"
-)
+<details>
+<summary>⚡ Operational Enhancements</summary>
 
-fig.update_traces(textposition="middle center", textfont_size=10)
-fig.update_layout(
-    xaxis_title="Feasibility Score (1-10)",
-    yaxis_title="Impact Score (1-10)",
-    width=800,
-    height=600
-)
+#### Operational KPI Enhancement Actions
 
-# Add quadrant lines
-fig.add_hline(y=5, line_dash="dash", line_color="gray", opacity=0.5)
-fig.add_vline(x=5, line_dash="dash", line_color="gray", opacity=0.5)
+**For Bed Utilization Optimization:**
+- Predictive admission planning
+- Discharge planning improvements
+- Transfer coordination
+- Capacity management systems
 
-st.plotly_chart(fig, use_container_width=True)
+**For Patient Satisfaction Improvement:**
+- Communication training
+- Service quality programs
+- Wait time reductions
+- Patient feedback systems
 
-# KPI Targets and Thresholds
-st.header("🎯 KPI Targets and Thresholds")
+</details>
+"""
 
-threshold_data = {
-    "KPI": [
+# Display-only tables, rendered through the cached static HTML table helper
+THRESHOLD_DATA = {
+    "KPI": (
         "30-Day Readmission Rate",
         "Model Accuracy", 
         "Patient Satisfaction",
         "Cost per Readmission"
-    ],
-    "Excellent (Green)": [
+    ),
+    "Excellent (Green)": (
         "< 8%",
         "> 90%",
         "> 4.8/5.0",
         "< $12,000"
-    ],
-    "Good (Yellow)": [
+    ),
+    "Good (Yellow)": (
         "8-12%",
         "85-90%",
         "4.0-4.8/5.0",
         "$12,000-$18,000"
-    ],
-    "Needs Improvement (Red)": [
+    ),
+    "Needs Improvement (Red)": (
         "> 12%",
         "< 85%",
         "< 4.0/5.0",
         "> $18,000"
-    ],
-    "Current Status": [
+    ),
+    "Current Status": (
         "12.3% (Yellow)",
         "87.2% (Yellow)",
         "4.6/5.0 (Green)",
         "$15,500 (Yellow)"
-    ]
+    )
 }
 
-threshold_df = pd.DataFrame(threshold_data)
-st.dataframe(threshold_df, use_container_width=True)
-
-# KPI Reporting Schedule
-st.header("📅 KPI Reporting Schedule")
-
-reporting_schedule = {
-    "KPI Category": [
+REPORTING_SCHEDULE = {
+    "KPI Category": (
         "Clinical KPIs",
         "Financial KPIs",
         "Operational KPIs",
         "Model Performance KPIs"
-    ],
-    "Reporting Frequency": [
+    ),
+    "Reporting Frequency": (
         "Weekly",
         "Monthly",
         "Daily",
         "Real-time"
-    ],
-    "Audience": [
+    ),
+    "Audience": (
         "Clinical Teams, Hospital Admin",
         "Finance Team, Executives",
         "Operations Team, Department Heads",
         "Data Science Team, IT"
-    ],
-    "Report Format": [
+    ),
+    "Report Format": (
         "Clinical Dashboard",
         "Financial Summary Report",
         "Operations Dashboard",
         "Technical Performance Report"
-    ]
+    )
 }
 
-schedule_df = pd.DataFrame(reporting_schedule)
-st.dataframe(schedule_df, use_container_width=True)
-
-# KPI Action Plans
-st.header("🚀 KPI Improvement Action Plans")
-
-action_tabs = st.tabs(["🏥 Clinical Improvements", "💰 Financial Optimizations", "⚡ Operational Enhancements"])
-
-with action_tabs[0]:
-    st.subheader("Clinical KPI Improvement Actions")
-    st.markdown("""
-    **For 30-Day Readmission Rate Reduction:**
-    - Implement post-discharge follow-up protocols
-    - Enhanced patient education programs
-    - Medication reconciliation improvements
-    - Chronic disease management programs
-    
-    **For Treatment Success Rate Improvement:**
-    - Evidence-based treatment protocols
-    - Personalized care plans
-    - Multidisciplinary team approaches
-    - Continuous clinical training
-    """)
-
-with action_tabs[1]:
-    st.subheader("Financial KPI Optimization Actions")
-    st.markdown("""
-    **For Cost per Readmission Reduction:**
-    - Preventive care investments
-    - Efficient resource allocation
-    - Value-based care contracts
-    - Technology automation
-    
-    **For Revenue per Patient Optimization:**
-    - Service line expansion
-    - Quality-based reimbursements
-    - Insurance negotiation improvements
-    - Billing process optimization
-    """)
-
-with action_tabs[2]:
-    st.subheader("Operational KPI Enhancement Actions")
-    st.markdown("""
-    **For Bed Utilization Optimization:**
-    - Predictive admission planning
-    - Discharge planning improvements
-    - Transfer coordination
-    - Capacity management systems
-    
-    **For Patient Satisfaction Improvement:**
-    - Communication training
-    - Service quality programs
-    - Wait time reductions
-    - Patient feedback systems
-    """)
-
-# KPI Success Stories
-st.header("🏆 Expected Success Stories")
-
-success_col1, success_col2 = st.columns(2)
-
-with success_col1:
-    st.markdown("""
-    ### 📈 6-Month Targets
-    - Reduced 30-day readmission rate from 15% to 11%
-    - Improved model accuracy from 82% to 88%
-    - Achieved $2M in annual cost savings
-    - Increased patient satisfaction to 4.6/5.0
-    - Reduced average length of stay by 1 day
-    """)
-
-with success_col2:
-    st.markdown("""
-    ### 🎯 12-Month Vision
-    - Industry-leading readmission rate of <8%
-    - Model accuracy consistently >90%
-    - $5M+ in annual cost savings
-    - Patient satisfaction >4.8/5.0
-    - Top quartile performance in all clinical metrics
-    """)
-
-# KPI Implementation Roadmap
-st.header("🗺️ KPI Implementation Roadmap")
-
-roadmap_data = {
-    "Phase": [
+ROADMAP_DATA = {
+    "Phase": (
         "Phase 1: Foundation",
         "Phase 2: Implementation", 
         "Phase 3: Optimization",
         "Phase 4: Excellence"
-    ],
-    "Duration": [
+    ),
+    "Duration": (
         "Months 1-2",
         "Months 3-6",
         "Months 7-9", 
         "Months 10-12"
-    ],
-    "Key Activities": [
+    ),
+    "Key Activities": (
         "Baseline measurement, Dashboard setup, Data collection",
         "Model deployment, Staff training, Process integration",
         "Performance tuning, Feedback incorporation, Scaling",
         "Advanced analytics, Benchmarking, Continuous improvement"
-    ],
-    "Success Metrics": [
+    ),
+    "Success Metrics": (
         "All KPIs baseline established",
         "80% of targets met",
         "90% of targets met",
         "Industry-leading performance"
-    ]
+    )
 }
 
-roadmap_df = pd.DataFrame(roadmap_data)
-st.dataframe(roadmap_df, use_container_width=True)
-
-# Next Steps
-st.header("🚀 Next Steps")
-st.markdown("""
+NEXT_STEPS_MD = """
 **KPI Definition Complete! ✅**
 
 You have successfully:
@@ -598,4 +345,459 @@ You have successfully:
 5. 🔄 **Regular Review** - Weekly/monthly performance reviews
 
 **Ready to proceed?** Navigate to the **Data Preprocessing** page to prepare the dataset for analysis and modeling.
+"""
+
+@st.cache_data(show_spinner=False)
+def clinical_kpi_table():
+    """Clinical KPI definitions, targets and baselines."""
+    return pd.DataFrame(dict(CLINICAL_KPIS))
+
+@st.cache_data(show_spinner=False)
+def financial_kpi_table():
+    """Financial KPI definitions, targets and impact."""
+    return pd.DataFrame(dict(FINANCIAL_KPIS))
+
+@st.cache_data(show_spinner=False)
+def operational_kpi_table():
+    """Operational KPI definitions, targets and measurement frequency."""
+    return pd.DataFrame(dict(OPERATIONAL_KPIS))
+
+@st.cache_data(show_spinner=False)
+def model_kpi_table():
+    """Model performance KPI definitions, targets and critical levels."""
+    return pd.DataFrame(dict(MODEL_KPIS))
+
+@st.cache_data(show_spinner=False)
+def kpi_trend_table():
+    """Monthly sample readmission rate and model accuracy trend."""
+    return pd.DataFrame({
+        "Month": TREND_MONTHS,
+        "Readmission Rate": TREND_READMISSION,
+        "Model Accuracy": TREND_ACCURACY
+    })
+
+@st.cache_data(show_spinner=False)
+def kpi_priority_table():
+    """Impact, feasibility and priority score per KPI."""
+    # Scores are 1-10 so they fit in a byte; priority is derived rather than hand-typed
+    impact = np.array([9, 8, 8, 7, 9, 6, 5, 6], dtype=np.int8)
+    feasibility = np.array([8, 9, 7, 8, 6, 8, 9, 7], dtype=np.int8)
+    
+    kpi_priority_data = {
+        "KPI": (
+            "30-Day Readmission Rate", "Model Accuracy", "Patient Satisfaction",
+            "Cost per Readmission", "Treatment Success Rate", "Length of Stay",
+            "System Response Time", "Staff Efficiency"
+        ),
+        "Impact": impact,
+        "Feasibility": feasibility,
+        "Priority Score": np.add(impact, feasibility)
+    }
+    
+    return pd.DataFrame(kpi_priority_data)
+
+@st.cache_resource
+def bar_figure(names, values, title, x_title, y_title, target=None):
+    """Bar chart of values per KPI, grouped against target values when given.
+    
+    Arguments are tuples or small numpy arrays so each distinct chart gets its own cache entry.
+    """
+    # Imported here so the page loads without Plotly until a chart is first built
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    
+    if target is None:
+        # Single series coloured by its own value
+        fig.add_trace(go.Bar(
+            x=names,
+            y=values,
+            marker=dict(color=values, colorscale='RdYlGn', showscale=True)
+        ))
+    else:
+        fig.add_trace(go.Bar(
+            name='Current Performance',
+            x=names,
+            y=values,
+            marker_color='lightcoral'
+        ))
+        
+        fig.add_trace(go.Bar(
+            name='Target Performance',
+            x=names,
+            y=target,
+            marker_color='lightgreen'
+        ))
+    
+    fig.update_layout(
+        title=title,
+        xaxis_title=x_title,
+        yaxis_title=y_title,
+        barmode='group'
+    )
+    
+    return fig.to_dict()
+
+@st.cache_resource
+def radar_figure(categories, current, target, title):
+    """Radar of current against target performance on a 0-100 scale."""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatterpolar(
+        r=target,
+        theta=categories,
+        fill='toself',
+        name='Target Performance',
+        line_color='green'
+    ))
+    
+    fig.add_trace(go.Scatterpolar(
+        r=current,
+        theta=categories,
+        fill='toself',
+        name='Current Performance',
+        line_color='orange'
+    ))
+    
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100]
+            )),
+        showlegend=True,
+        title=title
+    )
+    
+    return fig.to_dict()
+
+@st.cache_resource
+def kpi_trend_figure():
+    """Readmission rate and model accuracy trends on twin y-axes."""
+    import plotly.graph_objects as go
+    
+    trend_df = kpi_trend_table()
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=TREND_MONTHS,
+        y=trend_df["Readmission Rate"],
+        mode='lines+markers',
+        name='Readmission Rate (%)',
+        line=dict(color='red'),
+        yaxis='y'
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=TREND_MONTHS,
+        y=trend_df["Model Accuracy"],
+        mode='lines+markers',
+        name='Model Accuracy (%)',
+        line=dict(color='blue'),
+        yaxis='y2'
+    ))
+    
+    fig.update_layout(
+        title='KPI Trends Over Time',
+        xaxis_title='Month',
+        yaxis=dict(
+            title='Readmission Rate (%)',
+            side='left',
+            range=[10, 16]
+        ),
+        yaxis2=dict(
+            title='Model Accuracy (%)',
+            side='right',
+            overlaying='y',
+            range=[80, 90]
+        ),
+        hovermode='x unified'
+    )
+    
+    return fig.to_dict()
+
+@st.cache_resource
+def kpi_priority_figure():
+    """Impact against feasibility scatter with quadrant guides."""
+    import plotly.graph_objects as go
+    
+    kpi_priority_df = kpi_priority_table()
+    priority = kpi_priority_df["Priority Score"].to_numpy()
+    
+    # Create priority matrix; sizeref reproduces Plotly Express' area scaling (size_max=20)
+    fig = go.Figure(go.Scatter(
+        x=kpi_priority_df["Feasibility"].to_numpy(),
+        y=kpi_priority_df["Impact"].to_numpy(),
+        text=kpi_priority_df["KPI"].tolist(),
+        mode='markers+text',
+        textposition="middle center",
+        textfont_size=10,
+        marker=dict(
+            size=priority,
+            sizemode='area',
+            sizeref=2.0 * priority.max() / 20 ** 2,
+            color=priority,
+            colorscale="viridis",
+            showscale=True
+        )
+    ))
+    
+    fig.update_layout(
+        title="KPI Prioritization Matrix: Impact vs Feasibility",
+        xaxis_title="Feasibility Score (1-10)",
+        yaxis_title="Impact Score (1-10)",
+        width=800,
+        height=600
+    )
+    
+    # Add quadrant lines
+    fig.add_hline(y=5, line_dash="dash", line_color="gray", opacity=0.5)
+    fig.add_vline(x=5, line_dash="dash", line_color="gray", opacity=0.5)
+    
+    return fig.to_dict()
+
+def basic_chart_html(fig, static=False):
+    """Chart markup that loads only the cartesian plotly.js basic bundle from the CDN."""
+    import plotly.io as pio
+    from plotly.offline import get_plotlyjs_version
+    
+    # Pin the bundle to the plotly.js version this plotly release serializes for
+    bundle_url = PLOTLY_BASIC_JS.format(version=get_plotlyjs_version())
+    return pio.to_html(fig, include_plotlyjs=bundle_url, full_html=False,
+                       config={'staticPlot': static})
+
+@st.cache_resource
+def kpi_trend_html():
+    """Trend chart markup; left interactive for its unified hover."""
+    return basic_chart_html(kpi_trend_figure())
+
+@st.cache_resource
+def kpi_trend_png():
+    """Trend chart rendered once to PNG bytes with kaleido.
+    
+    Returns None when rendering fails, e.g. kaleido 1.x without a Chrome
+    binary, so the caller can fall back to the HTML embed.
+    """
+    import plotly.graph_objects as go
+    
+    try:
+        return go.Figure(kpi_trend_figure()).to_image(format='png', width=900, height=450, scale=2)
+    except Exception:
+        return None
+
+@st.cache_resource
+def kpi_priority_html():
+    """Prioritization matrix markup with hover and zoom handlers disabled."""
+    return basic_chart_html(kpi_priority_figure(), static=True)
+
+@st.cache_resource
+def reference_sections():
+    """Render plan for the thresholds and reporting schedule sections."""
+    return (
+        ("header", "🎯 KPI Targets and Thresholds"),
+        ("table", pd.DataFrame(THRESHOLD_DATA)),
+        ("header", "📅 KPI Reporting Schedule"),
+        ("table", pd.DataFrame(REPORTING_SCHEDULE))
+    )
+
+@st.cache_resource
+def closing_sections():
+    """Render plan for the roadmap and next steps sections."""
+    return (
+        ("header", "🗺️ KPI Implementation Roadmap"),
+        ("table", pd.DataFrame(ROADMAP_DATA)),
+        ("header", "🚀 Next Steps"),
+        ("markdown", NEXT_STEPS_MD)
+    )
+
+# Tables go through render_table, whose HTML is cached per distinct frame
+SECTION_RENDERERS = {
+    "header": st.header,
+    "table": render_table,
+    "markdown": st.markdown
+}
+
+def render_sections(sections):
+    """Replay a cached (kind, payload) render plan."""
+    for kind, payload in sections:
+        SECTION_RENDERERS[kind](payload)
+
+def clinical_tab():
+    """Clinical KPI table and current-vs-target chart."""
+    st.subheader("Clinical Performance Indicators")
+    
+    st.table(clinical_kpi_table())
+    
+    # Clinical KPI Visualization
+    fig = bar_figure(
+        tuple(CLINICAL_KPIS["KPI Name"]),
+        CLINICAL_CURRENT,
+        'Clinical KPIs: Current vs Target Performance',
+        'KPI',
+        'Value (%)',
+        target=CLINICAL_TARGET
+    )
+    st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
+
+def financial_tab():
+    """Financial KPI table and impact chart."""
+    st.subheader("Financial Performance Indicators")
+    
+    st.table(financial_kpi_table())
+    
+    # Financial Impact Visualization
+    fig = bar_figure(
+        tuple(FINANCIAL_KPIS["KPI Name"]),
+        FINANCIAL_IMPACT,
+        "Financial KPIs - Impact Assessment",
+        'Financial KPI',
+        'Impact Score (1-5)'
+    )
+    st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
+
+def operational_tab():
+    """Operational KPI table."""
+    st.subheader("Operational Performance Indicators")
+    
+    st.table(operational_kpi_table())
+
+def model_tab():
+    """Model performance KPI table and radar chart."""
+    st.subheader("Model Performance Indicators")
+    
+    st.table(model_kpi_table())
+    
+    # Model Performance Radar Chart
+    fig = radar_figure(
+        ('Accuracy', 'Precision', 'Recall', 'F1-Score', 'AUC-ROC'),
+        MODEL_CURRENT,
+        MODEL_TARGET,
+        "Model Performance KPIs: Current vs Target"
+    )
+    st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
+
+@st.cache_resource
+def kpi_metrics_html():
+    """Sample dashboard metrics as one flex row, styled after st.metric."""
+    # (label, value, delta, lower_is_better)
+    metrics = (
+        ("30-Day Readmission Rate", "12.3%", "-2.7%", True),
+        ("Model Accuracy", "87.2%", "+4.1%", False),
+        ("Cost Savings (Monthly)", "$425K", "+$75K", False),
+        ("Patient Satisfaction", "4.6/5.0", "+0.3", False)
+    )
+    cards = []
+    for label, value, delta, lower_is_better in metrics:
+        falling = delta.startswith("-")
+        color = "#09ab3b" if falling == lower_is_better else "#ff2b2b"
+        arrow = "↓" if falling else "↑"
+        cards.append(
+            f'<div style="flex: 1;">'
+            f'<div style="font-size: 0.875rem; color: #666;">{label}</div>'
+            f'<div style="font-size: 2.25rem;">{value}</div>'
+            f'<div style="font-size: 0.875rem; color: {color};">{arrow} {delta}</div>'
+            f'</div>'
+        )
+    return '<div style="display: flex; gap: 1rem;">' + "".join(cards) + '</div>'
+
+def kpi_dashboard_metrics():
+    """Sample real-time KPI metric row."""
+    st.subheader("🎛️ Real-time KPI Monitoring")
+    
+    st.markdown(kpi_metrics_html(), unsafe_allow_html=True)
+
+def kpi_trend_chart():
+    """KPI trend analysis chart."""
+    st.subheader("📊 KPI Trend Analysis")
+    
+    png = kpi_trend_png() if kaleido is not None else None
+    if png is not None:
+        st.image(png, use_container_width=True)
+    else:
+        components.html(kpi_trend_html(), height=470)
+
+def kpi_priority_matrix():
+    """KPI prioritization copy and matrix chart."""
+    st.markdown("""
+    We prioritize KPIs based on their impact on patient outcomes and business value, 
+    as well as the feasibility of measurement and improvement.
+    """)
+    
+    components.html(kpi_priority_html(), height=620)
+
+st.title("📊 Key Performance Indicators (KPI) Definition")
+st.markdown("---")
+
+st.markdown("""
+Defining clear, measurable KPIs is essential for tracking the success of our healthcare analytics project. 
+These indicators will help us measure progress toward reducing hospital readmissions and improving patient outcomes.
 """)
+
+# KPI Categories
+st.header("🎯 KPI Categories")
+
+kpi_tabs = st.tabs(["🏥 Clinical KPIs", "💰 Financial KPIs", "⚡ Operational KPIs", "🤖 Model Performance KPIs"])
+
+with kpi_tabs[0]:
+    clinical_tab()
+
+with kpi_tabs[1]:
+    financial_tab()
+
+with kpi_tabs[2]:
+    operational_tab()
+
+with kpi_tabs[3]:
+    model_tab()
+
+# KPI Dashboard Design
+st.header("📈 KPI Dashboard Design")
+
+kpi_dashboard_metrics()
+
+# KPI Trend Analysis
+kpi_trend_chart()
+
+# KPI Prioritization Matrix
+st.header("🎯 KPI Prioritization Matrix")
+
+kpi_priority_matrix()
+
+# KPI Targets, Thresholds and Reporting Schedule
+render_sections(reference_sections())
+
+# KPI Action Plans
+st.header("🚀 KPI Improvement Action Plans")
+
+st.markdown(ACTION_PLANS_HTML, unsafe_allow_html=True)
+
+# KPI Success Stories
+st.header("🏆 Expected Success Stories")
+
+success_col1, success_col2 = st.columns(2)
+
+with success_col1:
+    st.markdown("""
+    ### 📈 6-Month Targets
+    - Reduced 30-day readmission rate from 15% to 11%
+    - Improved model accuracy from 82% to 88%
+    - Achieved $2M in annual cost savings
+    - Increased patient satisfaction to 4.6/5.0
+    - Reduced average length of stay by 1 day
+    """)
+
+with success_col2:
+    st.markdown("""
+    ### 🎯 12-Month Vision
+    - Industry-leading readmission rate of <8%
+    - Model accuracy consistently >90%
+    - $5M+ in annual cost savings
+    - Patient satisfaction >4.8/5.0
+    - Top quartile performance in all clinical metrics
+    """)
+
+# KPI Implementation Roadmap and Next Steps
+render_sections(closing_sections())
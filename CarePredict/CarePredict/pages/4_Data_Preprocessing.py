@@ -1,3 +1,4 @@
+import io
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -6,13 +7,199 @@ import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import seaborn as sns
 import matplotlib.pyplot as plt
-from sklearn.preprocessing import StandardScaler, LabelEncoder
+from sklearn.preprocessing import StandardScaler
 from sklearn.impute import SimpleImputer
+from utils.data_store import read_dataset, dataset_key, processed_key, store_processed
+from utils.fastmath import length_of_stay
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow is optional; exports fall back to CSV only
+    pa = None
+
+try:
+    import polars as pl
+except ImportError:  # polars is optional; the statistical summary falls back to pandas
+    pl = None
+
 st.set_page_config(page_title="Data Preprocessing", page_icon="🔧", layout="wide")
 
+# Above this many levels one-hot encoding produces an unwieldy, mostly-zero block
+MAX_ONE_HOT_LEVELS = 50
+
+# Admission and discharge dates in the source dataset are ISO formatted
+DATE_FORMAT = '%Y-%m-%d'
+
+@st.cache_data(show_spinner=False)
+def quality_summary(data_key, _data):
+    """Missing and duplicate counts plus the per-column quality table.
+    
+    Keyed on the uploaded dataset so reruns skip the full-frame scans.
+    """
+    # One counting pass for nulls and one for uniques, instead of a scan per metric
+    non_null = _data.count()
+    nulls = len(_data) - non_null
+    
+    # The first three rows serve as samples unless a column has gaps to skip
+    samples = _data.head(3).to_dict(orient='list')
+    for col in nulls.index[nulls > 0]:
+        samples[col] = _data[col].dropna().head(3).tolist()
+    
+    data_quality = pd.DataFrame({
+        'Column': _data.columns,
+        'Data Type': _data.dtypes.astype(str),
+        'Non-Null Count': non_null,
+        'Null Count': nulls,
+        'Null Percentage': (nulls / len(_data) * 100).round(2),
+        'Unique Values': _data.nunique(dropna=True),
+        'Sample Values': [str(samples[col]) for col in _data.columns]
+    })
+    
+    return {
+        'missing_count': data_quality['Null Count'].sum(),
+        'duplicate_count': _data.duplicated().sum(),
+        'data_quality': data_quality
+    }
+
+@st.cache_data(show_spinner=False)
+def iqr_bounds(data_key, column, _values):
+    """Tukey fences (1.5 x IQR) for one column, shared by the outlier tabs."""
+    # A single partitioning pass over the raw array; NaNs are skipped like Series.quantile
+    q1, q3 = np.nanquantile(_values.to_numpy(dtype=np.float64), [0.25, 0.75])
+    iqr = q3 - q1
+    return q1 - 1.5 * iqr, q3 + 1.5 * iqr
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def report_stats(key, _df, processed=False):
+    """Size, missing, duplicate and column-type counts for the data quality report.
+    
+    The original dataset counts columns named like dates; the processed one
+    counts columns actually parsed to datetime.
+    """
+    missing = int(_df.isnull().sum().sum())
+    if processed:
+        dates = sum(dtype == 'datetime64[ns]' for dtype in _df.dtypes)
+    else:
+        dates = sum('date' in col.lower() for col in _df.columns)
+    
+    return {
+        'rows': len(_df),
+        'cols': len(_df.columns),
+        'missing': missing,
+        'missing_pct': missing / (len(_df) * len(_df.columns)) * 100,
+        'duplicates': int(_df.duplicated().sum()),
+        'numerical': len(_df.select_dtypes(include=[np.number]).columns),
+        'categorical': len(_df.select_dtypes(include=['object', 'category', 'string']).columns),
+        'dates': dates
+    }
+
+@st.cache_data(show_spinner=False)
+def numeric_summary(data_key, columns, _data):
+    """describe()-style statistics for the numerical columns.
+    
+    Uses polars' multithreaded describe when available, with linear
+    quantiles and the null-count row dropped so it matches pandas' layout.
+    """
+    if pl is not None and pa is not None:
+        stats = pl.from_pandas(_data[list(columns)]).describe(interpolation='linear').to_pandas()
+        stats = stats.set_index('statistic').drop(index='null_count')
+        stats.index.name = None
+        return stats
+    return _data[list(columns)].describe()
+
+def column_types(data_key, data):
+    """Numerical, categorical and date column names of the dataset.
+    
+    The dtype scan runs once per uploaded dataset; the lists are kept in
+    session state and reused on every rerun until a new file is loaded.
+    """
+    if st.session_state.get('_column_types_key') != data_key:
+        st.session_state['_column_types'] = {
+            'numerical': data.select_dtypes(include=[np.number]).columns.tolist(),
+            'categorical': data.select_dtypes(include=['object', 'category', 'string']).columns.tolist(),
+            'date': [col for col in data.columns if data[col].dtype == 'datetime64[ns]' or 'date' in col.lower()]
+        }
+        st.session_state['_column_types_key'] = data_key
+    return st.session_state['_column_types']
+
+@st.cache_resource(max_entries=4)
+def compact_text_columns(data_key, columns, _data, _unique_counts):
+    """Converted copies of the dataset's remaining object text columns.
+    
+    Repetitive columns become category; near-unique ones such as names,
+    where codes would only add overhead, become Arrow-backed strings when
+    pyarrow is installed. Built once per upload and shared without copying:
+    under copy-on-write a page that modifies a column gets its own buffer.
+    """
+    converted = {}
+    for col in columns:
+        if _data[col].dtype == object:
+            if _unique_counts[col] <= len(_data) // 2:
+                converted[col] = _data[col].astype('category')
+            elif pa is not None:
+                converted[col] = _data[col].astype('string[pyarrow]')
+    return converted
+
+def parse_dates(values):
+    """Convert a column to datetime, trying the dataset's ISO format first.
+    
+    The explicit format uses pandas' vectorized parser and ``cache=True``
+    parses each distinct date string once; other layouts fall back to
+    format inference.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    try:
+        return pd.to_datetime(values, format=DATE_FORMAT, cache=True)
+    except (ValueError, TypeError):
+        return pd.to_datetime(values, cache=True)
+
+@st.cache_resource
+def missing_values_figure(data_key, _missing):
+    """Horizontal bar chart of the per-column missing-value counts."""
+    return px.bar(
+        x=_missing.values,
+        y=_missing.index,
+        orientation='h',
+        title='Missing Values by Column',
+        labels={'x': 'Number of Missing Values', 'y': 'Columns'}
+    )
+
+@st.cache_resource
+def distribution_figures(data_key, column, _values):
+    """Histogram and box plot of one numerical column."""
+    frame = _values.to_frame()
+    histogram = px.histogram(
+        frame, 
+        x=column,
+        title=f'Distribution of {column}',
+        nbins=30
+    )
+    box = px.box(
+        frame,
+        y=column,
+        title=f'Box Plot of {column}'
+    )
+    return histogram, box
+
+@st.cache_resource
+def category_figures(data_key, column, _counts):
+    """Bar and pie charts of one categorical column's value counts."""
+    bar = px.bar(
+        x=_counts.index,
+        y=_counts.values,
+        title=f'Distribution of {column}'
+    )
+    bar.update_xaxes(tickangle=45)
+    pie = px.pie(
+        values=_counts.values,
+        names=_counts.index,
+        title=f'Proportion of {column}'
+    )
+    return bar, pie
+
 st.title("🔧 Data Preprocessing")
 st.markdown("---")
 
@@ -27,7 +214,9 @@ if 'healthcare_data' not in st.session_state:
     st.markdown("Navigate to the main page and upload the healthcare_dataset.csv file to continue.")
     st.stop()
 
-data = st.session_state['healthcare_data'].copy()
+data = read_dataset()
+summary = quality_summary(dataset_key(), data)
+column_lists = column_types(dataset_key(), data)
 
 # Data Quality Assessment
 st.header("📊 Data Quality Assessment")
@@ -39,44 +228,29 @@ with col1:
 with col2:
     st.metric("Total Features", len(data.columns))
 with col3:
-    missing_count = data.isnull().sum().sum()
+    missing_count = summary['missing_count']
     st.metric("Missing Values", missing_count)
 with col4:
-    duplicate_count = data.duplicated().sum()
+    duplicate_count = summary['duplicate_count']
     st.metric("Duplicate Records", duplicate_count)
 
 # Data Types and Missing Values Analysis
 st.subheader("🔍 Data Types and Missing Values")
 
-# Create data quality summary
-data_quality = pd.DataFrame({
-    'Column': data.columns,
-    'Data Type': data.dtypes.astype(str),
-    'Non-Null Count': data.count(),
-    'Null Count': data.isnull().sum(),
-    'Null Percentage': (data.isnull().sum() / len(data) * 100).round(2),
-    'Unique Values': [data[col].nunique() for col in data.columns],
-    'Sample Values': [str(data[col].dropna().head(3).tolist()) for col in data.columns]
-})
+st.dataframe(summary['data_quality'], use_container_width=True)
 
-st.dataframe(data_quality, use_container_width=True)
+# Per-column null counts come from the cached summary; no further scans needed
+null_counts = summary['data_quality']['Null Count']
 
 # Missing Values Visualization
-if data.isnull().sum().sum() > 0:
+if missing_count > 0:
     st.subheader("📈 Missing Values Pattern")
     
-    missing_data = data.isnull().sum().sort_values(ascending=False)
+    missing_data = null_counts.sort_values(ascending=False)
     missing_data = missing_data[missing_data > 0]
     
     if len(missing_data) > 0:
-        fig = px.bar(
-            x=missing_data.values,
-            y=missing_data.index,
-            orientation='h',
-            title='Missing Values by Column',
-            labels={'x': 'Number of Missing Values', 'y': 'Columns'}
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(missing_values_figure(dataset_key(), missing_data), use_container_width=True)
     else:
         st.success("✅ No missing values detected in the dataset!")
 else:
@@ -86,8 +260,17 @@ else:
 st.header("📊 Data Distribution Analysis")
 
 # Numerical columns analysis
-numerical_cols = data.select_dtypes(include=[np.number]).columns.tolist()
-categorical_cols = data.select_dtypes(include=['object']).columns.tolist()
+numerical_cols = column_lists['numerical']
+categorical_cols = column_lists['categorical']
+
+# The loader already stores the known categoricals as category; the other text
+# columns are converted once per upload so value counts and encodings work on
+# integer codes, and every rerun just swaps in the cached columns
+text_columns = compact_text_columns(
+    dataset_key(), tuple(categorical_cols), data, summary['data_quality']['Unique Values']
+)
+for col, values in text_columns.items():
+    data[col] = values
 
 if numerical_cols:
     st.subheader("📈 Numerical Variables Distribution")
@@ -100,31 +283,22 @@ if numerical_cols:
         selected_num_col = st.selectbox("Select numerical column for distribution analysis:", numerical_cols)
         
         if selected_num_col:
+            # Figures are built once per dataset and column, not on every rerun
+            histogram, box = distribution_figures(dataset_key(), selected_num_col, data[selected_num_col])
             col1, col2 = st.columns(2)
             
             with col1:
                 # Histogram
-                fig = px.histogram(
-                    data, 
-                    x=selected_num_col,
-                    title=f'Distribution of {selected_num_col}',
-                    nbins=30
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(histogram, use_container_width=True)
             
             with col2:
                 # Box plot
-                fig = px.box(
-                    data,
-                    y=selected_num_col,
-                    title=f'Box Plot of {selected_num_col}'
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(box, use_container_width=True)
     
     with num_tabs[1]:
         # Statistical summary
         st.markdown("### Statistical Summary of Numerical Variables")
-        st.dataframe(data[numerical_cols].describe(), use_container_width=True)
+        st.dataframe(numeric_summary(dataset_key(), tuple(numerical_cols), data), use_container_width=True)
     
     with num_tabs[2]:
         # Outlier detection
@@ -134,11 +308,7 @@ if numerical_cols:
         
         if selected_outlier_col:
             # Calculate IQR
-            Q1 = data[selected_outlier_col].quantile(0.25)
-            Q3 = data[selected_outlier_col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
+            lower_bound, upper_bound = iqr_bounds(dataset_key(), selected_outlier_col, data[selected_outlier_col])
             
             outliers = data[(data[selected_outlier_col] < lower_bound) | (data[selected_outlier_col] > upper_bound)]
             
@@ -161,27 +331,17 @@ if categorical_cols:
     selected_cat_col = st.selectbox("Select categorical column for analysis:", categorical_cols)
     
     if selected_cat_col:
+        # Value counts
+        value_counts = data[selected_cat_col].value_counts()
+        bar, pie = category_figures(dataset_key(), selected_cat_col, value_counts)
         col1, col2 = st.columns(2)
         
         with col1:
-            # Value counts
-            value_counts = data[selected_cat_col].value_counts()
-            fig = px.bar(
-                x=value_counts.index,
-                y=value_counts.values,
-                title=f'Distribution of {selected_cat_col}'
-            )
-            fig.update_xaxis(tickangle=45)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(bar, use_container_width=True)
         
         with col2:
             # Pie chart
-            fig = px.pie(
-                values=value_counts.values,
-                names=value_counts.index,
-                title=f'Proportion of {selected_cat_col}'
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(pie, use_container_width=True)
         
         # Show value counts table
         st.markdown(f"#### Value Counts for {selected_cat_col}")
@@ -200,66 +360,71 @@ cleaning_tabs = st.tabs(["Missing Values", "Duplicates", "Data Types", "Outliers
 with cleaning_tabs[0]:
     st.subheader("🔧 Missing Values Treatment")
     
-    if data.isnull().sum().sum() > 0:
+    if missing_count > 0:
         st.markdown("#### Missing Values Treatment Options:")
         
-        missing_cols = data.columns[data.isnull().any()].tolist()
+        missing_cols = null_counts.index[null_counts > 0].tolist()
         
-        for col in missing_cols:
-            st.markdown(f"**{col}** - {data[col].isnull().sum()} missing values")
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                if data[col].dtype in ['object']:
+        # Treatments are chosen together and applied in one pass on submit
+        with st.form("missing_value_treatments"):
+            treatments = {}
+            for col in missing_cols:
+                st.markdown(f"**{col}** - {null_counts[col]} missing values")
+                
+                if data[col].dtype.name in ('object', 'category', 'string'):
                     # Categorical column
-                    treatment = st.selectbox(
-                        f"Treatment for {col}:",
-                        ["Keep as is", "Fill with mode", "Fill with 'Unknown'", "Drop rows"],
-                        key=f"missing_{col}"
-                    )
+                    options = ["Keep as is", "Fill with mode", "Fill with 'Unknown'", "Drop rows"]
                 else:
                     # Numerical column
-                    treatment = st.selectbox(
-                        f"Treatment for {col}:",
-                        ["Keep as is", "Fill with mean", "Fill with median", "Fill with mode", "Drop rows"],
-                        key=f"missing_{col}"
-                    )
+                    options = ["Keep as is", "Fill with mean", "Fill with median", "Fill with mode", "Drop rows"]
+                treatments[col] = st.selectbox(f"Treatment for {col}:", options, key=f"missing_{col}")
             
-            with col2:
-                if st.button(f"Apply treatment for {col}", key=f"apply_{col}"):
-                    if treatment == "Fill with mean" and data[col].dtype in ['int64', 'float64']:
-                        data[col].fillna(data[col].mean(), inplace=True)
-                        st.success(f"✅ Filled {col} missing values with mean")
-                    elif treatment == "Fill with median" and data[col].dtype in ['int64', 'float64']:
-                        data[col].fillna(data[col].median(), inplace=True)
-                        st.success(f"✅ Filled {col} missing values with median")
-                    elif treatment == "Fill with mode":
-                        data[col].fillna(data[col].mode()[0], inplace=True)
-                        st.success(f"✅ Filled {col} missing values with mode")
-                    elif treatment == "Fill with 'Unknown'":
-                        data[col].fillna('Unknown', inplace=True)
-                        st.success(f"✅ Filled {col} missing values with 'Unknown'")
-                    elif treatment == "Drop rows":
-                        data.dropna(subset=[col], inplace=True)
-                        st.success(f"✅ Dropped rows with missing {col} values")
-                    
-                    # Update session state
-                    st.session_state['healthcare_data_processed'] = data
-                    st.rerun()
+            submitted = st.form_submit_button("Apply treatments")
+        
+        if submitted:
+            # Means and medians for every column that needs one, in a single aggregation
+            averaged = [col for col, treatment in treatments.items() if treatment in ("Fill with mean", "Fill with median")]
+            averages = data[averaged].agg(['mean', 'median']) if averaged else None
+            
+            fill_values = {}
+            drop_cols = []
+            for col, treatment in treatments.items():
+                if treatment == "Fill with mean":
+                    fill_values[col] = averages.at['mean', col]
+                elif treatment == "Fill with median":
+                    fill_values[col] = averages.at['median', col]
+                elif treatment == "Fill with mode":
+                    fill_values[col] = data[col].value_counts(sort=False).idxmax()
+                elif treatment == "Fill with 'Unknown'":
+                    if data[col].dtype.name == 'category' and 'Unknown' not in data[col].cat.categories:
+                        data[col] = data[col].cat.add_categories('Unknown')
+                    fill_values[col] = 'Unknown'
+                elif treatment == "Drop rows":
+                    drop_cols.append(col)
+            
+            if fill_values:
+                data = data.fillna(fill_values)
+            if drop_cols:
+                data = data.dropna(subset=drop_cols)
+            st.success(f"✅ Filled {len(fill_values)} columns and dropped rows missing {len(drop_cols)} columns")
+            
+            # Update session state
+            store_processed(data)
+            st.rerun()
     else:
         st.success("✅ No missing values to treat!")
 
 with cleaning_tabs[1]:
     st.subheader("🔄 Duplicate Records Treatment")
     
-    duplicate_count = data.duplicated().sum()
+    duplicate_count = summary['duplicate_count']
     
     if duplicate_count > 0:
         st.warning(f"Found {duplicate_count} duplicate records")
         
         if st.button("Remove Duplicate Records"):
             data = data.drop_duplicates()
-            st.session_state['healthcare_data_processed'] = data
+            store_processed(data)
             st.success(f"✅ Removed {duplicate_count} duplicate records")
             st.rerun()
     else:
@@ -285,9 +450,9 @@ with cleaning_tabs[2]:
             if data[col].dtype != 'datetime64[ns]':
                 if st.button(f"Convert {col} to datetime", key=f"date_{col}"):
                     try:
-                        data[col] = pd.to_datetime(data[col])
+                        data[col] = parse_dates(data[col])
                         st.success(f"✅ Converted {col} to datetime")
-                        st.session_state['healthcare_data_processed'] = data
+                        store_processed(data)
                         st.rerun()
                     except Exception as e:
                         st.error(f"❌ Error converting {col}: {str(e)}")
@@ -304,11 +469,7 @@ with cleaning_tabs[3]:
         
         if selected_outlier_treatment_col:
             # Calculate outliers
-            Q1 = data[selected_outlier_treatment_col].quantile(0.25)
-            Q3 = data[selected_outlier_treatment_col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
+            lower_bound, upper_bound = iqr_bounds(dataset_key(), selected_outlier_treatment_col, data[selected_outlier_treatment_col])
             
             outliers_mask = (data[selected_outlier_treatment_col] < lower_bound) | (data[selected_outlier_treatment_col] > upper_bound)
             outlier_count = outliers_mask.sum()
@@ -326,8 +487,10 @@ with cleaning_tabs[3]:
                         data = data[~outliers_mask]
                         st.success(f"✅ Removed {outlier_count} outliers")
                     elif treatment_method == "Cap outliers (Winsorization)":
-                        data.loc[data[selected_outlier_treatment_col] < lower_bound, selected_outlier_treatment_col] = lower_bound
-                        data.loc[data[selected_outlier_treatment_col] > upper_bound, selected_outlier_treatment_col] = upper_bound
+                        # One vectorized clip pass instead of two masked .loc writes
+                        data[selected_outlier_treatment_col] = np.clip(
+                            data[selected_outlier_treatment_col].to_numpy(), lower_bound, upper_bound
+                        )
                         st.success(f"✅ Capped outliers to bounds [{lower_bound:.2f}, {upper_bound:.2f}]")
                     elif treatment_method == "Transform with log":
                         if (data[selected_outlier_treatment_col] > 0).all():
@@ -336,7 +499,7 @@ with cleaning_tabs[3]:
                         else:
                             st.error("❌ Cannot apply log transformation to non-positive values")
                     
-                    st.session_state['healthcare_data_processed'] = data
+                    store_processed(data)
                     st.rerun()
             else:
                 st.success(f"✅ No outliers found in {selected_outlier_treatment_col}")
@@ -350,7 +513,7 @@ with feature_tabs[0]:
     st.subheader("📅 Date Feature Engineering")
     
     # Check for date columns
-    date_cols = [col for col in data.columns if data[col].dtype == 'datetime64[ns]' or 'date' in col.lower()]
+    date_cols = column_lists['date']
     
     if date_cols:
         selected_date_col = st.selectbox("Select date column for feature extraction:", date_cols)
@@ -359,17 +522,25 @@ with feature_tabs[0]:
             try:
                 # Convert to datetime if not already
                 if data[selected_date_col].dtype != 'datetime64[ns]':
-                    data[selected_date_col] = pd.to_datetime(data[selected_date_col])
+                    data[selected_date_col] = parse_dates(data[selected_date_col])
                 
-                # Extract features
-                data[f'{selected_date_col}_year'] = data[selected_date_col].dt.year
-                data[f'{selected_date_col}_month'] = data[selected_date_col].dt.month
-                data[f'{selected_date_col}_day'] = data[selected_date_col].dt.day
-                data[f'{selected_date_col}_weekday'] = data[selected_date_col].dt.dayofweek
-                data[f'{selected_date_col}_quarter'] = data[selected_date_col].dt.quarter
+                # Extract features in one assign; narrow integer types need every date present
+                dates = data[selected_date_col].dt
+                complete = data[selected_date_col].notna().all()
+                features = {
+                    'year': (dates.year, np.int16),
+                    'month': (dates.month, np.int8),
+                    'day': (dates.day, np.int8),
+                    'weekday': (dates.dayofweek, np.int8),
+                    'quarter': (dates.quarter, np.int8)
+                }
+                data = data.assign(**{
+                    f'{selected_date_col}_{name}': values.astype(dtype) if complete else values
+                    for name, (values, dtype) in features.items()
+                })
                 
                 st.success(f"✅ Extracted date features from {selected_date_col}")
-                st.session_state['healthcare_data_processed'] = data
+                store_processed(data)
                 st.rerun()
                 
             except Exception as e:
@@ -388,23 +559,29 @@ with feature_tabs[1]:
             ["Label Encoding", "One-Hot Encoding", "Frequency Encoding"]
         )
         
-        if st.button("Apply Encoding", key="apply_encoding"):
+        if encoding_method == "One-Hot Encoding" and data[selected_cat_encode_col].nunique() > MAX_ONE_HOT_LEVELS:
+            st.error(f"❌ {selected_cat_encode_col} has more than {MAX_ONE_HOT_LEVELS} categories; use label or frequency encoding instead")
+        elif st.button("Apply Encoding", key="apply_encoding"):
             if encoding_method == "Label Encoding":
-                le = LabelEncoder()
-                data[f'{selected_cat_encode_col}_encoded'] = le.fit_transform(data[selected_cat_encode_col].astype(str))
+                # Category codes come from pandas' hash table; missing values encode as -1
+                data[f'{selected_cat_encode_col}_encoded'] = data[selected_cat_encode_col].astype('category').cat.codes.astype('int32')
                 st.success(f"✅ Applied label encoding to {selected_cat_encode_col}")
                 
             elif encoding_method == "One-Hot Encoding":
-                dummies = pd.get_dummies(data[selected_cat_encode_col], prefix=selected_cat_encode_col)
+                # One byte per indicator, numeric so models can consume it directly
+                dummies = pd.get_dummies(data[selected_cat_encode_col], prefix=selected_cat_encode_col, dtype=np.uint8)
                 data = pd.concat([data, dummies], axis=1)
                 st.success(f"✅ Applied one-hot encoding to {selected_cat_encode_col}")
                 
             elif encoding_method == "Frequency Encoding":
-                freq_map = data[selected_cat_encode_col].value_counts().to_dict()
-                data[f'{selected_cat_encode_col}_frequency'] = data[selected_cat_encode_col].map(freq_map)
+                # Mapping through the counts Series is a vectorized index lookup; on category
+                # columns the result can itself be categorical, so go through float before filling
+                # missing values with 0
+                counts = data[selected_cat_encode_col].value_counts()
+                data[f'{selected_cat_encode_col}_frequency'] = data[selected_cat_encode_col].map(counts).astype(np.float64).fillna(0).astype(np.int32)
                 st.success(f"✅ Applied frequency encoding to {selected_cat_encode_col}")
             
-            st.session_state['healthcare_data_processed'] = data
+            store_processed(data)
             st.rerun()
 
 with feature_tabs[2]:
@@ -420,26 +597,21 @@ with feature_tabs[2]:
         
         if selected_scale_cols and st.button("Apply Scaling", key="apply_scaling"):
             if scaling_method == "Standard Scaling (Z-score)":
-                scaler = StandardScaler()
-                for col in selected_scale_cols:
-                    data[f'{col}_scaled'] = scaler.fit_transform(data[[col]])
-                st.success(f"✅ Applied standard scaling to selected columns")
-                
+                scaler, suffix, label = StandardScaler(), 'scaled', "standard"
             elif scaling_method == "Min-Max Scaling":
                 from sklearn.preprocessing import MinMaxScaler
-                scaler = MinMaxScaler()
-                for col in selected_scale_cols:
-                    data[f'{col}_minmax'] = scaler.fit_transform(data[[col]])
-                st.success(f"✅ Applied min-max scaling to selected columns")
-                
+                scaler, suffix, label = MinMaxScaler(), 'minmax', "min-max"
             elif scaling_method == "Robust Scaling":
                 from sklearn.preprocessing import RobustScaler
-                scaler = RobustScaler()
-                for col in selected_scale_cols:
-                    data[f'{col}_robust'] = scaler.fit_transform(data[[col]])
-                st.success(f"✅ Applied robust scaling to selected columns")
+                scaler, suffix, label = RobustScaler(), 'robust', "robust"
+            
+            # Every scaler works per feature, so one fit over the whole block matches
+            # fitting each column separately; float32 input keeps float32 output
+            values = data[selected_scale_cols].to_numpy(dtype=np.float32, na_value=np.nan)
+            data[[f'{col}_{suffix}' for col in selected_scale_cols]] = scaler.fit_transform(values)
+            st.success(f"✅ Applied {label} scaling to selected columns")
             
-            st.session_state['healthcare_data_processed'] = data
+            store_processed(data)
             st.rerun()
 
 with feature_tabs[3]:
@@ -460,14 +632,20 @@ with feature_tabs[3]:
         if st.button("Calculate Length of Stay", key="los_calc"):
             try:
                 # Ensure datetime format
-                data[admission_col] = pd.to_datetime(data[admission_col])
-                data[discharge_col] = pd.to_datetime(data[discharge_col])
+                data[admission_col] = parse_dates(data[admission_col])
+                data[discharge_col] = parse_dates(data[discharge_col])
                 
                 # Calculate length of stay
-                data['length_of_stay'] = (data[discharge_col] - data[admission_col]).dt.days
+                los = np.empty(len(data), dtype=np.float64)
+                length_of_stay(
+                    data[admission_col].to_numpy(dtype='datetime64[ns]').view(np.int64),
+                    data[discharge_col].to_numpy(dtype='datetime64[ns]').view(np.int64),
+                    los
+                )
+                data['length_of_stay'] = los
                 
                 st.success("✅ Created Length of Stay feature")
-                st.session_state['healthcare_data_processed'] = data
+                store_processed(data)
                 st.rerun()
                 
             except Exception as e:
@@ -476,21 +654,15 @@ with feature_tabs[3]:
     st.markdown("#### Age Groups")
     if 'age' in data.columns:
         if st.button("Create Age Groups", key="age_groups"):
-            def categorize_age(age):
-                if age < 18:
-                    return 'Child'
-                elif age < 35:
-                    return 'Young Adult'
-                elif age < 55:
-                    return 'Middle Age'
-                elif age < 75:
-                    return 'Senior'
-                else:
-                    return 'Elderly'
-            
-            data['age_group'] = data['age'].apply(categorize_age)
+            # Left-closed bins: under 18, 18-34, 35-54, 55-74, 75 and over
+            data['age_group'] = pd.cut(
+                data['age'],
+                bins=[-np.inf, 18, 35, 55, 75, np.inf],
+                labels=['Child', 'Young Adult', 'Middle Age', 'Senior', 'Elderly'],
+                right=False
+            )
             st.success("✅ Created age group categories")
-            st.session_state['healthcare_data_processed'] = data
+            store_processed(data)
             st.rerun()
 
 # Data Validation
@@ -499,18 +671,19 @@ st.header("✅ Data Validation")
 # Show processed data summary
 if 'healthcare_data_processed' in st.session_state:
     processed_data = st.session_state['healthcare_data_processed']
+    stored_stats = report_stats(processed_key(), processed_data, processed=True)
     
     st.subheader("📊 Processed Data Summary")
     
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Records", f"{len(processed_data):,}")
+        st.metric("Records", f"{stored_stats['rows']:,}")
     with col2:
-        st.metric("Features", len(processed_data.columns))
+        st.metric("Features", stored_stats['cols'])
     with col3:
-        st.metric("Missing Values", processed_data.isnull().sum().sum())
+        st.metric("Missing Values", stored_stats['missing'])
     with col4:
-        st.metric("Duplicates", processed_data.duplicated().sum())
+        st.metric("Duplicates", stored_stats['duplicates'])
     
     # Show data preview
     st.subheader("📋 Processed Data Preview")
@@ -518,18 +691,39 @@ if 'healthcare_data_processed' in st.session_state:
     
     # Data export option
     st.subheader("💾 Export Processed Data")
+    # Only the chosen format is serialized; Parquet keeps dtypes and is far smaller
+    # and quicker to write than CSV
+    export_formats = ["Parquet", "CSV"] if pa is not None else ["CSV"]
+    export_format = st.radio("Export format:", export_formats, horizontal=True, key="export_format")
+    
     if st.button("Prepare Data for Download"):
-        csv = processed_data.to_csv(index=False)
-        st.download_button(
-            label="Download Processed Dataset",
-            data=csv,
-            file_name=f"healthcare_processed_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            mime="text/csv"
-        )
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        if export_format == "Parquet":
+            buffer = io.BytesIO()
+            processed_data.to_parquet(buffer, engine='pyarrow', compression='zstd', index=False)
+            st.download_button(
+                label="Download Processed Dataset (Parquet)",
+                data=buffer.getvalue(),
+                file_name=f"healthcare_processed_{stamp}.parquet",
+                mime="application/octet-stream"
+            )
+        else:
+            csv = processed_data.to_csv(index=False)
+            st.download_button(
+                label="Download Processed Dataset",
+                data=csv,
+                file_name=f"healthcare_processed_{stamp}.csv",
+                mime="text/csv"
+            )
 
 # Data Quality Report
 st.header("📋 Data Quality Report")
 
+# Both sides are cached; the working frame is rebuilt untreated from the upload on
+# every rerun, the same frame store_processed() files under version 0
+original_stats = report_stats(dataset_key(), st.session_state['healthcare_data'])
+processed_stats = report_stats((dataset_key(), 0), data, processed=True)
+
 quality_report = {
     "Metric": [
         "Total Records",
@@ -541,22 +735,22 @@ quality_report = {
         "Date Features"
     ],
     "Original Data": [
-        f"{len(st.session_state['healthcare_data']):,}",
-        len(st.session_state['healthcare_data'].columns),
-        f"{st.session_state['healthcare_data'].isnull().sum().sum() / (len(st.session_state['healthcare_data']) * len(st.session_state['healthcare_data'].columns)) * 100:.2f}%",
-        st.session_state['healthcare_data'].duplicated().sum(),
-        len(st.session_state['healthcare_data'].select_dtypes(include=[np.number]).columns),
-        len(st.session_state['healthcare_data'].select_dtypes(include=['object']).columns),
-        len([col for col in st.session_state['healthcare_data'].columns if 'date' in col.lower()])
+        f"{original_stats['rows']:,}",
+        original_stats['cols'],
+        f"{original_stats['missing_pct']:.2f}%",
+        original_stats['duplicates'],
+        original_stats['numerical'],
+        original_stats['categorical'],
+        original_stats['dates']
     ],
     "Processed Data": [
-        f"{len(data):,}",
-        len(data.columns),
-        f"{data.isnull().sum().sum() / (len(data) * len(data.columns)) * 100:.2f}%",
-        data.duplicated().sum(),
-        len(data.select_dtypes(include=[np.number]).columns),
-        len(data.select_dtypes(include=['object']).columns),
-        len([col for col in data.columns if data[col].dtype == 'datetime64[ns]'])
+        f"{processed_stats['rows']:,}",
+        processed_stats['cols'],
+        f"{processed_stats['missing_pct']:.2f}%",
+        processed_stats['duplicates'],
+        processed_stats['numerical'],
+        processed_stats['categorical'],
+        processed_stats['dates']
     ]
 }
 
@@ -564,7 +758,7 @@ quality_df = pd.DataFrame(quality_report)
 st.dataframe(quality_df, use_container_width=True)
 
 # Update session state with processed data
-st.session_state['healthcare_data_processed'] = data
+store_processed(data, treatment=False)
 
 # Preprocessing Summary
 st.header("📋 Preprocessing Summary")
@@ -581,7 +775,7 @@ if 'healthcare_data' in st.session_state:
         new_features = len(data.columns) - len(original_data.columns)
         preprocessing_steps.append(f"✅ Created {new_features} new features")
     
-    if data.isnull().sum().sum() != original_data.isnull().sum().sum():
+    if processed_stats['missing'] != original_stats['missing']:
         preprocessing_steps.append("✅ Handled missing values")
     
     preprocessing_steps.extend([
@@ -7,11 +7,248 @@ from plotly.subplots import make_subplots
 import seaborn as sns
 import matplotlib.pyplot as plt
 from datetime import datetime
+from utils.data_store import read_dataset, dataset_key, processed_key
+from utils.fastmath import bucket_index, group_rate
 import warnings
 warnings.filterwarnings('ignore')
 
 st.set_page_config(page_title="Data Visualization", page_icon="📈", layout="wide")
 
+# Larger frames are drawn from a fixed sample of this many rows in scatter plots
+SCATTER_SAMPLE_SIZE = 5000
+
+# From this many points WebGL rendering is much faster than SVG
+WEBGL_MIN_POINTS = 1000
+
+# The aggregations below are cached on the key of the frame they summarize; the
+# frame itself is passed as an underscore argument so Streamlit never hashes it.
+# Each applied treatment gives the processed frame a new key, so the caches are
+# bounded to keep superseded results and figures from piling up.
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def key_metrics(data_key, age_col, condition_col, billing_col, _data):
+    """Headline dashboard figures; entries for missing columns are None.
+    
+    The averages and the condition count come from a single agg call.
+    """
+    aggregations = {
+        col: func for col, func in ((age_col, 'mean'), (billing_col, 'mean'), (condition_col, 'nunique')) if col
+    }
+    values = _data.agg(aggregations) if aggregations else pd.Series(dtype=np.float64)
+    return {
+        'avg_age': values[age_col] if age_col else None,
+        'avg_billing': values[billing_col] if billing_col else None,
+        'conditions': int(values[condition_col]) if condition_col else None
+    }
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def value_counts(data_key, column, _values):
+    """Value counts of one column, most frequent first.
+    
+    Categorical columns are counted with a bincount over their codes instead
+    of hashing every value; like value_counts, unused categories count zero.
+    """
+    if _values.dtype.name != 'category':
+        return _values.value_counts()
+    
+    codes = _values.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(_values.cat.categories))
+    counts = pd.Series(
+        counts,
+        index=pd.CategoricalIndex(_values.cat.categories, dtype=_values.dtype, name=_values.name),
+        name='count'
+    )
+    return counts.sort_values(ascending=False, kind='stable')
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def group_means(data_key, by, column, _data):
+    """Mean of ``column`` for each level of ``by``.
+    
+    A categorical ``by`` is reduced with weighted bincounts over its codes;
+    missing values are skipped and empty groups are NaN, as in groupby().mean().
+    """
+    groups = _data[by]
+    if groups.dtype.name != 'category':
+        return _data.groupby(by)[column].mean()
+    
+    codes = groups.cat.codes.to_numpy()
+    values = _data[column].to_numpy(dtype=np.float64, na_value=np.nan)
+    present = (codes >= 0) & ~np.isnan(values)
+    n_groups = len(groups.cat.categories)
+    sums = np.bincount(codes[present], weights=values[present], minlength=n_groups)
+    counts = np.bincount(codes[present], minlength=n_groups)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = sums / counts
+    return pd.Series(
+        means,
+        index=pd.CategoricalIndex(groups.cat.categories, dtype=groups.dtype, name=by),
+        name=column
+    )
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def age_groups(data_key, _ages):
+    """Patient ages binned into the five age groups used across the page.
+    
+    The compiled bucket_index kernel produces the same right-closed codes
+    as pd.cut over these edges; ages outside them (or missing) are NaN.
+    """
+    codes = np.empty(len(_ages), dtype=np.int8)
+    bucket_index(_ages.to_numpy(dtype=np.float64, na_value=np.nan), np.array([0, 18, 35, 55, 75, 100], dtype=np.float64), codes)
+    groups = pd.Categorical.from_codes(codes, categories=['<18', '18-34', '35-54', '55-74', '75+'], ordered=True)
+    return pd.Series(groups, index=_ages.index, name='Age_Group')
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def condition_age_counts(data_key, condition_col, _conditions, _age_groups):
+    """Patient counts for each medical condition and age group pair."""
+    frame = pd.DataFrame({condition_col: _conditions, 'Age_Group': _age_groups})
+    return frame.groupby([condition_col, 'Age_Group']).size().reset_index(name='Count')
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def crosstab(data_key, index, columns, _rows, _columns, normalize=False):
+    """Contingency table of two columns, as row percentages when ``normalize`` is set.
+    
+    Two categorical columns are tabulated with a single bincount over their
+    combined codes; empty rows and columns are dropped as pd.crosstab does.
+    """
+    if _rows.dtype.name != 'category' or _columns.dtype.name != 'category':
+        if normalize:
+            return pd.crosstab(_rows, _columns, normalize='index') * 100
+        return pd.crosstab(_rows, _columns)
+    
+    row_codes = _rows.cat.codes.to_numpy()
+    column_codes = _columns.cat.codes.to_numpy()
+    n_rows, n_columns = len(_rows.cat.categories), len(_columns.cat.categories)
+    # Code -1 marks a missing value on either side
+    present = (row_codes >= 0) & (column_codes >= 0)
+    flat = row_codes[present].astype(np.int64) * n_columns + column_codes[present]
+    counts = np.bincount(flat, minlength=n_rows * n_columns).reshape(n_rows, n_columns)
+    
+    table = pd.DataFrame(
+        counts,
+        index=pd.CategoricalIndex(_rows.cat.categories, dtype=_rows.dtype, name=_rows.name),
+        columns=pd.CategoricalIndex(_columns.cat.categories, dtype=_columns.dtype, name=_columns.name)
+    )
+    table = table.loc[counts.sum(axis=1) > 0, counts.sum(axis=0) > 0]
+    if normalize:
+        return table.div(table.sum(axis=1), axis=0) * 100
+    return table
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def abnormal_flags(data_key, _results):
+    """Boolean array marking the abnormal test results."""
+    return np.asarray(_results == 'Abnormal', dtype=np.bool_)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def abnormal_rates(data_key, by, _groups, _abnormal):
+    """Percentage of abnormal test results within each group.
+    
+    Categorical groups are reduced by the compiled group_rate kernel in one
+    pass over the codes; other dtypes use a grouped mean of the flags.
+    """
+    if _groups.dtype.name != 'category':
+        return pd.Series(_abnormal, index=_groups.index).groupby(_groups).mean() * 100
+    
+    rates = np.empty(len(_groups.cat.categories), dtype=np.float64)
+    group_rate(_groups.cat.codes.to_numpy(), _abnormal, rates)
+    return pd.Series(rates, index=pd.CategoricalIndex(_groups.cat.categories, dtype=_groups.dtype, name=_groups.name))
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def describe(data_key, columns, _data):
+    """describe() statistics of the given columns."""
+    return _data[list(columns)].describe()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def summary_statistics(data_key, column, _values):
+    """Mean, median, sample standard deviation, min and max of one column.
+    
+    Only the statistics the page shows are computed, skipping the extra
+    quantiles describe() would sort for.
+    """
+    values = _values.to_numpy(dtype=np.float64, na_value=np.nan)
+    return {
+        'mean': np.nanmean(values),
+        '50%': np.nanmedian(values),
+        'std': np.nanstd(values, ddof=1),
+        'min': np.nanmin(values),
+        'max': np.nanmax(values)
+    }
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def correlation_matrix(data_key, columns, _data):
+    """Pairwise Pearson correlations of the given numerical columns.
+    
+    Kept as float32: the heatmap, the pairs table and the scatter title all
+    read this one cached matrix, and need no more precision.
+    """
+    return _data[list(columns)].corr().astype(np.float32)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def categorical_summary(data_key, columns, _data):
+    """Unique count and most frequent value of each categorical column."""
+    cat_summary = []
+    for col in columns:
+        # One value_counts gives the top value and its frequency without sorting modes
+        counts = _data[col].value_counts()
+        cat_summary.append({
+            'Column': col,
+            'Unique Values': _data[col].nunique(),
+            'Most Frequent': counts.index[0] if len(counts) > 0 else 'N/A',
+            'Frequency of Most Common': int(counts.iloc[0]) if len(counts) > 0 else 0
+        })
+    return pd.DataFrame(cat_summary)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def admission_counts(data_key, column, _dates):
+    """Admission counts by month, weekday and year, from one pass over the dates.
+    
+    Months and weekdays are counted with bincount into fixed-length arrays, so
+    months or weekdays without admissions show as zero.
+    """
+    dates = pd.to_datetime(_dates).dropna().dt
+    years, year_counts = np.unique(dates.year.to_numpy(), return_counts=True)
+    return {
+        'monthly': np.bincount(dates.month.to_numpy(), minlength=13)[1:].astype(np.int32),
+        'weekday': np.bincount(dates.dayofweek.to_numpy(), minlength=7).astype(np.int32),
+        'years': years,
+        'yearly': year_counts.astype(np.int32)
+    }
+
+@st.cache_resource(max_entries=16)
+def histogram_figure(data_key, column, bins, title, color, x_title, y_title, _values):
+    """Histogram binned with NumPy, so only the bin counts are sent to the browser."""
+    counts, edges = np.histogram(_values.dropna().to_numpy(dtype=np.float64), bins=bins)
+    
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        marker_color=color
+    ))
+    fig.update_layout(title=title, bargap=0)
+    fig.update_xaxes(title=x_title)
+    fig.update_yaxes(title=y_title)
+    return fig
+
+@st.cache_resource(max_entries=16)
+def correlation_scatter(data_key, x, y, title, _data):
+    """Scatter of two columns with a least-squares trend line.
+    
+    Large frames are plotted from a fixed random sample of rows; the trend
+    line is still fitted on every complete row.
+    """
+    pairs = _data[[x, y]].dropna()
+    points = pairs.sample(SCATTER_SAMPLE_SIZE, random_state=0) if len(pairs) > SCATTER_SAMPLE_SIZE else pairs
+    
+    trace = go.Scattergl if len(points) >= WEBGL_MIN_POINTS else go.Scatter
+    fig = go.Figure(trace(x=points[x], y=points[y], mode='markers', name='Patients'))
+    if len(pairs) > 1:
+        x_values = pairs[x].to_numpy(dtype=np.float64)
+        slope, intercept = np.polyfit(x_values, pairs[y].to_numpy(dtype=np.float64), 1)
+        line_x = np.array([x_values.min(), x_values.max()])
+        fig.add_trace(go.Scatter(x=line_x, y=slope * line_x + intercept, mode='lines', name='OLS trend'))
+    fig.update_layout(title=title, xaxis_title=x, yaxis_title=y)
+    return fig
+
 st.title("📈 Data Visualization & Insights")
 st.markdown("---")
 
@@ -22,65 +259,81 @@ and insights that will inform our predictive modeling and clinical recommendatio
 
 # Check if processed data is available
 if 'healthcare_data_processed' in st.session_state:
-    data = st.session_state['healthcare_data_processed'].copy()
+    data_key = processed_key()
+    # Shallow copy-on-write copy: column conversions on the page's frame must not
+    # reach the stored one, but no buffers are duplicated
+    data = st.session_state['healthcare_data_processed'].copy(deep=False)
 elif 'healthcare_data' in st.session_state:
-    data = st.session_state['healthcare_data'].copy()
+    data_key = dataset_key()
+    data = read_dataset()
 else:
     st.warning("⚠️ Please upload and process the healthcare dataset first.")
     st.markdown("Navigate to the main page to upload data and the Data Preprocessing page to clean it.")
     st.stop()
 
+# Resolve the dataset's columns once, whatever their spelling
+column_index = {col.lower().replace(' ', '_'): col for col in data.columns}
+condition_col = column_index.get('medical_condition')
+billing_col = column_index.get('billing_amount')
+target_col = column_index.get('test_results')
+blood_col = column_index.get('blood_type')
+insurance_col = column_index.get('insurance_provider')
+gender_col = column_index.get('gender')
+
+# The loader stores these as category already; a frame that lost the dtype along the
+# way is converted back so value counts, groupbys and crosstabs work on integer codes
+for col in (condition_col, target_col, insurance_col, blood_col, gender_col):
+    if col and data[col].dtype == object:
+        data[col] = data[col].astype('category')
+
+# Column types for the correlation and summary sections, classified once; the
+# preprocessing page may hand over Arrow-backed 'string' columns as well
+numerical_cols = data.select_dtypes(include=[np.number]).columns.tolist()
+categorical_cols = data.select_dtypes(include=['object', 'category', 'string']).columns.tolist()
+
+# Date columns for the temporal section and the report's time period
+date_columns = [
+    col for col in data.columns
+    if 'date' in col.lower() or pd.api.types.is_datetime64_any_dtype(data[col])
+]
+
+# One age binning shared by every tab that breaks results down by age group
+age_group = age_groups(data_key, data['age']) if 'age' in data.columns else None
+
 # Overview Dashboard
 st.header("📊 Healthcare Analytics Dashboard")
 
 # Key Metrics
+metrics = key_metrics(data_key, 'age' if 'age' in data.columns else None, condition_col, billing_col, data)
+
+# The abnormal-result flags are compared once and shared by the metric, risk and summary sections
+abnormal_mask = abnormal_flags(data_key, data[target_col]) if target_col else None
+abnormal_pct = abnormal_mask.mean() * 100 if target_col else None
 cols = st.columns(5)
 
 with cols[0]:
     st.metric("Total Patients", f"{len(data):,}")
 
 with cols[1]:
-    if 'age' in data.columns:
-        avg_age = data['age'].mean()
-        st.metric("Average Age", f"{avg_age:.1f} years")
+    if metrics['avg_age'] is not None:
+        st.metric("Average Age", f"{metrics['avg_age']:.1f} years")
     else:
         st.metric("Average Age", "N/A")
 
 with cols[2]:
-    condition_col = None
-    for col in ['medical_condition', 'Medical_Condition', 'Medical Condition']:
-        if col in data.columns:
-            condition_col = col
-            break
-    
     if condition_col:
-        unique_conditions = data[condition_col].nunique()
-        st.metric("Medical Conditions", unique_conditions)
+        st.metric("Medical Conditions", metrics['conditions'])
     else:
         st.metric("Medical Conditions", "N/A")
 
 with cols[3]:
-    billing_col = None
-    for col in ['billing_amount', 'Billing_Amount', 'Billing Amount']:
-        if col in data.columns:
-            billing_col = col
-            break
-    
     if billing_col:
-        avg_billing = data[billing_col].mean()
-        st.metric("Avg Billing", f"${avg_billing:,.0f}")
+        st.metric("Avg Billing", f"${metrics['avg_billing']:,.0f}")
     else:
         st.metric("Avg Billing", "N/A")
 
 with cols[4]:
-    target_col = None
-    for col in ['test_results', 'Test_Results', 'Test Results']:
-        if col in data.columns:
-            target_col = col
-            break
-    
     if target_col:
-        abnormal_pct = (data[target_col] == 'Abnormal').mean() * 100
         st.metric("Abnormal Tests", f"{abnormal_pct:.1f}%")
     else:
         st.metric("Abnormal Tests", "N/A")
@@ -88,16 +341,21 @@ with cols[4]:
 # Visualization Categories
 st.header("🎯 Visualization Categories")
 
-viz_tabs = st.tabs([
+# st.tabs runs every tab's body on each rerun; a horizontal radio renders (and
+# computes) only the section being viewed
+viz_sections = [
     "👥 Demographics", 
     "🏥 Medical Conditions", 
     "💰 Financial Analysis", 
     "📅 Temporal Patterns", 
     "🎯 Target Analysis",
     "🔗 Correlations"
-])
+]
+active_viz = st.radio(
+    "Visualization category", viz_sections, horizontal=True, label_visibility="collapsed", key="viz_section"
+)
 
-with viz_tabs[0]:
+if active_viz == viz_sections[0]:
     st.subheader("👥 Patient Demographics Analysis")
     
     demo_col1, demo_col2 = st.columns(2)
@@ -106,10 +364,10 @@ with viz_tabs[0]:
         # Gender Distribution
         if 'gender' in data.columns:
             st.markdown("#### Gender Distribution")
-            gender_counts = data['gender'].value_counts()
+            gender_counts = value_counts(data_key, 'gender', data['gender'])
             
             fig = px.pie(
-                values=gender_counts.values,
+                values=gender_counts.to_numpy(dtype=np.int32),
                 names=gender_counts.index,
                 title="Patient Gender Distribution",
                 color_discrete_sequence=['#FF6B6B', '#4ECDC4']
@@ -117,25 +375,19 @@ with viz_tabs[0]:
             st.plotly_chart(fig, use_container_width=True)
         
         # Blood Type Distribution
-        blood_col = None
-        for col in ['blood_type', 'Blood_Type', 'Blood Type']:
-            if col in data.columns:
-                blood_col = col
-                break
-        
         if blood_col:
             st.markdown("#### Blood Type Distribution")
             
-            blood_counts = data[blood_col].value_counts()
+            blood_counts = value_counts(data_key, blood_col, data[blood_col])
             fig = px.bar(
                 x=blood_counts.index,
-                y=blood_counts.values,
+                y=blood_counts.to_numpy(dtype=np.int32),
                 title="Blood Type Distribution",
-                color=blood_counts.values,
+                color=blood_counts.to_numpy(dtype=np.int32),
                 color_continuous_scale='viridis'
             )
-            fig.update_xaxis(title="Blood Type")
-            fig.update_yaxis(title="Count")
+            fig.update_xaxes(title="Blood Type")
+            fig.update_yaxes(title="Count")
             st.plotly_chart(fig, use_container_width=True)
     
     with demo_col2:
@@ -143,15 +395,9 @@ with viz_tabs[0]:
         if 'age' in data.columns:
             st.markdown("#### Age Distribution")
             
-            fig = px.histogram(
-                data,
-                x='age',
-                nbins=20,
-                title="Patient Age Distribution",
-                color_discrete_sequence=['#45B7D1']
+            fig = histogram_figure(
+                data_key, 'age', 20, "Patient Age Distribution", '#45B7D1', "Age (years)", "Count", data['age']
             )
-            fig.update_xaxis(title="Age (years)")
-            fig.update_yaxis(title="Count")
             st.plotly_chart(fig, use_container_width=True)
             
             # Age vs Gender
@@ -168,7 +414,7 @@ with viz_tabs[0]:
                 )
                 st.plotly_chart(fig, use_container_width=True)
 
-with viz_tabs[1]:
+if active_viz == viz_sections[1]:
     st.subheader("🏥 Medical Conditions Analysis")
     
     if condition_col:
@@ -178,17 +424,17 @@ with viz_tabs[1]:
             # Medical Conditions Distribution
             st.markdown("#### Medical Conditions Frequency")
             
-            condition_counts = data[condition_col].value_counts()
+            condition_counts = value_counts(data_key, condition_col, data[condition_col])
             fig = px.bar(
                 y=condition_counts.index,
-                x=condition_counts.values,
+                x=condition_counts.to_numpy(dtype=np.int32),
                 orientation='h',
                 title="Medical Conditions Distribution",
-                color=condition_counts.values,
+                color=condition_counts.to_numpy(dtype=np.int32),
                 color_continuous_scale='plasma'
             )
-            fig.update_xaxis(title="Number of Patients")
-            fig.update_yaxis(title="Medical Condition")
+            fig.update_xaxes(title="Number of Patients")
+            fig.update_yaxes(title="Medical Condition")
             st.plotly_chart(fig, use_container_width=True)
         
         with med_col2:
@@ -197,15 +443,10 @@ with viz_tabs[1]:
                 st.markdown("#### Medical Conditions by Age Group")
                 
                 # Create age groups
-                data_viz = data.copy()
-                data_viz['Age_Group'] = pd.cut(
-                    data_viz['age'], 
-                    bins=[0, 18, 35, 55, 75, 100], 
-                    labels=['<18', '18-34', '35-54', '55-74', '75+']
+                condition_age = condition_age_counts(
+                    data_key, condition_col, data[condition_col], age_group
                 )
                 
-                condition_age = data_viz.groupby([condition_col, 'Age_Group']).size().reset_index(name='Count')
-                
                 fig = px.bar(
                     condition_age,
                     x=condition_col,
@@ -214,18 +455,18 @@ with viz_tabs[1]:
                     title="Medical Conditions by Age Group",
                     barmode='stack'
                 )
-                fig.update_xaxis(tickangle=45)
+                fig.update_xaxes(tickangle=45)
                 st.plotly_chart(fig, use_container_width=True)
         
         # Medical Conditions by Gender
         if 'gender' in data.columns:
             st.markdown("#### Medical Conditions by Gender")
             
-            condition_gender = pd.crosstab(data[condition_col], data['gender'])
+            condition_gender = crosstab(data_key, condition_col, 'gender', data[condition_col], data['gender'])
             
             fig = px.bar(
                 x=condition_gender.index,
-                y=[condition_gender.iloc[:, 0], condition_gender.iloc[:, 1]],
+                y=[condition_gender.iloc[:, 0].to_numpy(dtype=np.int32), condition_gender.iloc[:, 1].to_numpy(dtype=np.int32)],
                 title="Medical Conditions by Gender",
                 barmode='group',
                 labels={'x': 'Medical Condition', 'y': 'Count'}
@@ -233,10 +474,10 @@ with viz_tabs[1]:
             if len(condition_gender.columns) >= 2:
                 fig.data[0].name = condition_gender.columns[0]
                 fig.data[1].name = condition_gender.columns[1]
-            fig.update_xaxis(tickangle=45)
+            fig.update_xaxes(tickangle=45)
             st.plotly_chart(fig, use_container_width=True)
 
-with viz_tabs[2]:
+if active_viz == viz_sections[2]:
     st.subheader("💰 Financial Analysis")
     
     if billing_col:
@@ -246,20 +487,15 @@ with viz_tabs[2]:
             # Billing Amount Distribution
             st.markdown("#### Billing Amount Distribution")
             
-            fig = px.histogram(
-                data,
-                x=billing_col,
-                nbins=30,
-                title="Billing Amount Distribution",
-                color_discrete_sequence=['#2E8B57']
+            fig = histogram_figure(
+                data_key, billing_col, 30, "Billing Amount Distribution", '#2E8B57',
+                "Billing Amount ($)", "Frequency", data[billing_col]
             )
-            fig.update_xaxis(title="Billing Amount ($)")
-            fig.update_yaxis(title="Frequency")
             st.plotly_chart(fig, use_container_width=True)
             
             # Summary Statistics
             st.markdown("#### Billing Statistics")
-            billing_stats = data[billing_col].describe()
+            billing_stats = summary_statistics(data_key, billing_col, data[billing_col])
             
             stats_df = pd.DataFrame({
                 'Statistic': ['Mean', 'Median', 'Std Dev', 'Min', 'Max'],
@@ -278,27 +514,21 @@ with viz_tabs[2]:
             if condition_col:
                 st.markdown("#### Average Billing by Medical Condition")
                 
-                billing_by_condition = data.groupby(condition_col)[billing_col].mean().sort_values(ascending=True)
+                billing_by_condition = group_means(data_key, condition_col, billing_col, data).sort_values(ascending=True)
                 
                 fig = px.bar(
                     y=billing_by_condition.index,
-                    x=billing_by_condition.values,
+                    x=billing_by_condition.to_numpy(dtype=np.float32),
                     orientation='h',
                     title="Average Billing by Medical Condition",
-                    color=billing_by_condition.values,
+                    color=billing_by_condition.to_numpy(dtype=np.float32),
                     color_continuous_scale='viridis'
                 )
-                fig.update_xaxis(title="Average Billing Amount ($)")
-                fig.update_yaxis(title="Medical Condition")
+                fig.update_xaxes(title="Average Billing Amount ($)")
+                fig.update_yaxes(title="Medical Condition")
                 st.plotly_chart(fig, use_container_width=True)
         
         # Insurance Provider Analysis
-        insurance_col = None
-        for col in ['insurance_provider', 'Insurance_Provider', 'Insurance Provider']:
-            if col in data.columns:
-                insurance_col = col
-                break
-        
         if insurance_col:
             st.markdown("#### Billing Analysis by Insurance Provider")
             
@@ -306,46 +536,40 @@ with viz_tabs[2]:
             
             with ins_col1:
                 # Average billing by insurance
-                avg_billing_insurance = data.groupby(insurance_col)[billing_col].mean().sort_values(ascending=False)
+                avg_billing_insurance = group_means(data_key, insurance_col, billing_col, data).sort_values(ascending=False)
                 
                 fig = px.bar(
                     x=avg_billing_insurance.index,
-                    y=avg_billing_insurance.values,
+                    y=avg_billing_insurance.to_numpy(dtype=np.float32),
                     title="Average Billing by Insurance Provider",
-                    color=avg_billing_insurance.values,
+                    color=avg_billing_insurance.to_numpy(dtype=np.float32),
                     color_continuous_scale='blues'
                 )
-                fig.update_xaxis(title="Insurance Provider", tickangle=45)
-                fig.update_yaxis(title="Average Billing ($)")
+                fig.update_xaxes(title="Insurance Provider", tickangle=45)
+                fig.update_yaxes(title="Average Billing ($)")
                 st.plotly_chart(fig, use_container_width=True)
             
             with ins_col2:
                 # Patient count by insurance
-                insurance_counts = data[insurance_col].value_counts()
+                insurance_counts = value_counts(data_key, insurance_col, data[insurance_col])
                 
                 fig = px.pie(
-                    values=insurance_counts.values,
+                    values=insurance_counts.to_numpy(dtype=np.int32),
                     names=insurance_counts.index,
                     title="Patient Distribution by Insurance Provider"
                 )
                 st.plotly_chart(fig, use_container_width=True)
 
-with viz_tabs[3]:
+if active_viz == viz_sections[3]:
     st.subheader("📅 Temporal Patterns Analysis")
     
-    # Find date columns
-    date_columns = []
-    for col in data.columns:
-        if 'date' in col.lower() or data[col].dtype == 'datetime64[ns]':
-            date_columns.append(col)
-    
     if date_columns:
         selected_date_col = st.selectbox("Select date column for temporal analysis:", date_columns)
         
         if selected_date_col:
-            # Ensure datetime format
+            # Parse the dates and count admissions, cached per column
             try:
-                data[selected_date_col] = pd.to_datetime(data[selected_date_col])
+                admissions = admission_counts(data_key, selected_date_col, data[selected_date_col])
                 
                 temp_col1, temp_col2 = st.columns(2)
                 
@@ -353,56 +577,48 @@ with viz_tabs[3]:
                     # Admissions by month
                     st.markdown("#### Admissions by Month")
                     
-                    data['Month'] = data[selected_date_col].dt.month
-                    data['Year'] = data[selected_date_col].dt.year
-                    
-                    monthly_admissions = data.groupby('Month').size()
                     month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
                                  'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
                     
                     fig = px.line(
                         x=month_names,
-                        y=monthly_admissions.values,
+                        y=admissions['monthly'],
                         title="Monthly Admission Patterns",
                         markers=True
                     )
-                    fig.update_xaxis(title="Month")
-                    fig.update_yaxis(title="Number of Admissions")
+                    fig.update_xaxes(title="Month")
+                    fig.update_yaxes(title="Number of Admissions")
                     st.plotly_chart(fig, use_container_width=True)
                 
                 with temp_col2:
                     # Admissions by day of week
                     st.markdown("#### Admissions by Day of Week")
                     
-                    data['Weekday'] = data[selected_date_col].dt.day_name()
                     weekday_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-                    weekday_admissions = data['Weekday'].value_counts().reindex(weekday_order, fill_value=0)
                     
                     fig = px.bar(
-                        x=weekday_admissions.index,
-                        y=weekday_admissions.values,
+                        x=weekday_order,
+                        y=admissions['weekday'],
                         title="Admissions by Day of Week",
-                        color=weekday_admissions.values,
+                        color=admissions['weekday'],
                         color_continuous_scale='plasma'
                     )
-                    fig.update_xaxis(title="Day of Week")
-                    fig.update_yaxis(title="Number of Admissions")
+                    fig.update_xaxes(title="Day of Week")
+                    fig.update_yaxes(title="Number of Admissions")
                     st.plotly_chart(fig, use_container_width=True)
                 
                 # Yearly trends if multiple years
-                if data['Year'].nunique() > 1:
+                if len(admissions['years']) > 1:
                     st.markdown("#### Yearly Admission Trends")
                     
-                    yearly_admissions = data.groupby('Year').size()
-                    
                     fig = px.line(
-                        x=yearly_admissions.index,
-                        y=yearly_admissions.values,
+                        x=admissions['years'],
+                        y=admissions['yearly'],
                         title="Yearly Admission Trends",
                         markers=True
                     )
-                    fig.update_xaxis(title="Year")
-                    fig.update_yaxis(title="Number of Admissions")
+                    fig.update_xaxes(title="Year")
+                    fig.update_yaxes(title="Number of Admissions")
                     st.plotly_chart(fig, use_container_width=True)
                 
             except Exception as e:
@@ -410,7 +626,7 @@ with viz_tabs[3]:
     else:
         st.info("No date columns found for temporal analysis")
 
-with viz_tabs[4]:
+if active_viz == viz_sections[4]:
     st.subheader("🎯 Target Variable Analysis")
     
     if target_col:
@@ -420,10 +636,10 @@ with viz_tabs[4]:
             # Target distribution
             st.markdown("#### Test Results Distribution")
             
-            target_counts = data[target_col].value_counts()
+            target_counts = value_counts(data_key, target_col, data[target_col])
             
             fig = px.pie(
-                values=target_counts.values,
+                values=target_counts.to_numpy(dtype=np.int32),
                 names=target_counts.index,
                 title="Test Results Distribution",
                 color_discrete_sequence=['#2ECC71', '#E74C3C', '#F39C12']
@@ -444,45 +660,38 @@ with viz_tabs[4]:
             if condition_col:
                 st.markdown("#### Test Results by Medical Condition")
                 
-                condition_target = pd.crosstab(data[condition_col], data[target_col], normalize='index') * 100
+                condition_target = crosstab(data_key, condition_col, target_col, data[condition_col], data[target_col], normalize=True)
                 
                 fig = px.bar(
                     condition_target,
                     title="Test Results Distribution by Medical Condition (%)",
                     barmode='stack'
                 )
-                fig.update_xaxis(title="Medical Condition", tickangle=45)
-                fig.update_yaxis(title="Percentage")
+                fig.update_xaxes(title="Medical Condition", tickangle=45)
+                fig.update_yaxes(title="Percentage")
                 st.plotly_chart(fig, use_container_width=True)
         
         # Target by demographics
         if 'age' in data.columns:
             st.markdown("#### Test Results by Age Group")
             
-            data_viz = data.copy()
-            data_viz['Age_Group'] = pd.cut(
-                data_viz['age'], 
-                bins=[0, 18, 35, 55, 75, 100], 
-                labels=['<18', '18-34', '35-54', '55-74', '75+']
+            age_target = crosstab(
+                data_key, 'Age_Group', target_col, age_group, data[target_col], normalize=True
             )
             
-            age_target = pd.crosstab(data_viz['Age_Group'], data_viz[target_col], normalize='index') * 100
-            
             fig = px.bar(
                 age_target,
                 title="Test Results Distribution by Age Group (%)",
                 barmode='stack',
                 color_discrete_sequence=['#2ECC71', '#E74C3C', '#F39C12']
             )
-            fig.update_xaxis(title="Age Group")
-            fig.update_yaxis(title="Percentage")
+            fig.update_xaxes(title="Age Group")
+            fig.update_yaxes(title="Percentage")
             st.plotly_chart(fig, use_container_width=True)
 
-with viz_tabs[5]:
+if active_viz == viz_sections[5]:
     st.subheader("🔗 Correlation Analysis")
     
-    # Select numerical columns for correlation
-    numerical_cols = data.select_dtypes(include=[np.number]).columns.tolist()
     
     if len(numerical_cols) > 1:
         corr_col1, corr_col2 = st.columns(2)
@@ -492,32 +701,32 @@ with viz_tabs[5]:
             st.markdown("#### Correlation Heatmap")
             
             # Calculate correlation matrix
-            corr_matrix = data[numerical_cols].corr()
+            corr_matrix = correlation_matrix(data_key, tuple(numerical_cols), data)
             
+            # Correlations always lie in [-1, 1]; a fixed range also centres the diverging scale on zero
             fig = px.imshow(
                 corr_matrix,
                 title="Feature Correlation Heatmap",
                 color_continuous_scale='RdBu',
+                zmin=-1,
+                zmax=1,
                 aspect='auto'
             )
-            fig.update_xaxis(tickangle=45)
+            fig.update_xaxes(tickangle=45)
             st.plotly_chart(fig, use_container_width=True)
         
         with corr_col2:
             # Top correlations
             st.markdown("#### Strongest Correlations")
             
-            # Get correlation pairs
-            corr_pairs = []
-            for i in range(len(corr_matrix.columns)):
-                for j in range(i+1, len(corr_matrix.columns)):
-                    corr_pairs.append({
-                        'Feature 1': corr_matrix.columns[i],
-                        'Feature 2': corr_matrix.columns[j],
-                        'Correlation': corr_matrix.iloc[i, j]
-                    })
-            
-            corr_df = pd.DataFrame(corr_pairs)
+            # Get correlation pairs from the upper triangle in one indexing step
+            corr_values = corr_matrix.to_numpy()
+            rows, cols = np.triu_indices_from(corr_values, k=1)
+            corr_df = pd.DataFrame({
+                'Feature 1': corr_matrix.columns[rows],
+                'Feature 2': corr_matrix.columns[cols],
+                'Correlation': corr_values[rows, cols]
+            })
             corr_df = corr_df.sort_values('Correlation', key=abs, ascending=False)
             
             # Display top 10 correlations
@@ -530,95 +739,79 @@ with viz_tabs[5]:
             # Select top correlation pair
             top_corr = corr_df.iloc[0]
             
-            fig = px.scatter(
-                data,
-                x=top_corr['Feature 1'],
-                y=top_corr['Feature 2'],
-                title=f"Relationship: {top_corr['Feature 1']} vs {top_corr['Feature 2']} (r={top_corr['Correlation']:.3f})",
-                trendline="ols"
+            fig = correlation_scatter(
+                data_key,
+                top_corr['Feature 1'],
+                top_corr['Feature 2'],
+                f"Relationship: {top_corr['Feature 1']} vs {top_corr['Feature 2']} (r={top_corr['Correlation']:.3f})",
+                data
             )
             st.plotly_chart(fig, use_container_width=True)
 
 # Advanced Analytics
 st.header("🔬 Advanced Analytics")
 
-advanced_tabs = st.tabs(["📊 Statistical Summary", "🎯 Risk Factors", "💡 Key Insights"])
+advanced_sections = ["📊 Statistical Summary", "🎯 Risk Factors", "💡 Key Insights"]
+active_advanced = st.radio(
+    "Advanced analytics", advanced_sections, horizontal=True, label_visibility="collapsed", key="advanced_section"
+)
 
-with advanced_tabs[0]:
+if active_advanced == advanced_sections[0]:
     st.subheader("📊 Comprehensive Statistical Summary")
     
     # Numerical summary
     if numerical_cols:
         st.markdown("#### Numerical Variables Summary")
-        st.dataframe(data[numerical_cols].describe(), use_container_width=True)
+        st.dataframe(describe(data_key, tuple(numerical_cols), data), use_container_width=True)
     
     # Categorical summary
-    categorical_cols = data.select_dtypes(include=['object']).columns.tolist()
     if categorical_cols:
         st.markdown("#### Categorical Variables Summary")
         
-        cat_summary = []
-        for col in categorical_cols:
-            cat_summary.append({
-                'Column': col,
-                'Unique Values': data[col].nunique(),
-                'Most Frequent': data[col].mode().iloc[0] if len(data[col].mode()) > 0 else 'N/A',
-                'Frequency of Most Common': data[col].value_counts().iloc[0] if len(data[col]) > 0 else 0
-            })
-        
-        cat_summary_df = pd.DataFrame(cat_summary)
+        cat_summary_df = categorical_summary(data_key, tuple(categorical_cols), data)
         st.dataframe(cat_summary_df, use_container_width=True)
 
-with advanced_tabs[1]:
+if active_advanced == advanced_sections[1]:
     st.subheader("🎯 Risk Factor Analysis")
     
     if target_col and condition_col:
         # Risk analysis by medical condition
         st.markdown("#### Risk Assessment by Medical Condition")
         
-        risk_analysis = data.groupby(condition_col)[target_col].apply(
-            lambda x: (x == 'Abnormal').mean() * 100
+        risk_analysis = abnormal_rates(
+            data_key, condition_col, data[condition_col], abnormal_mask
         ).sort_values(ascending=False)
         
         fig = px.bar(
             y=risk_analysis.index,
-            x=risk_analysis.values,
+            x=risk_analysis.to_numpy(dtype=np.float32),
             orientation='h',
             title="Abnormal Test Result Rate by Medical Condition",
-            color=risk_analysis.values,
+            color=risk_analysis.to_numpy(dtype=np.float32),
             color_continuous_scale='Reds'
         )
-        fig.update_xaxis(title="Abnormal Test Rate (%)")
-        fig.update_yaxis(title="Medical Condition")
+        fig.update_xaxes(title="Abnormal Test Rate (%)")
+        fig.update_yaxes(title="Medical Condition")
         st.plotly_chart(fig, use_container_width=True)
         
         # Risk by age group
         if 'age' in data.columns:
             st.markdown("#### Risk Assessment by Age Group")
             
-            data_risk = data.copy()
-            data_risk['Age_Group'] = pd.cut(
-                data_risk['age'], 
-                bins=[0, 18, 35, 55, 75, 100], 
-                labels=['<18', '18-34', '35-54', '55-74', '75+']
-            )
-            
-            age_risk = data_risk.groupby('Age_Group')[target_col].apply(
-                lambda x: (x == 'Abnormal').mean() * 100
-            )
+            age_risk = abnormal_rates(data_key, 'Age_Group', age_group, abnormal_mask)
             
             fig = px.bar(
                 x=age_risk.index,
-                y=age_risk.values,
+                y=age_risk.to_numpy(dtype=np.float32),
                 title="Abnormal Test Result Rate by Age Group",
-                color=age_risk.values,
+                color=age_risk.to_numpy(dtype=np.float32),
                 color_continuous_scale='Oranges'
             )
-            fig.update_xaxis(title="Age Group")
-            fig.update_yaxis(title="Abnormal Test Rate (%)")
+            fig.update_xaxes(title="Age Group")
+            fig.update_yaxes(title="Abnormal Test Rate (%)")
             st.plotly_chart(fig, use_container_width=True)
 
-with advanced_tabs[2]:
+if active_advanced == advanced_sections[2]:
     st.subheader("💡 Key Insights & Recommendations")
     
     # Generate insights based on the analysis
@@ -626,25 +819,24 @@ with advanced_tabs[2]:
     
     # Demographic insights
     if 'age' in data.columns:
-        avg_age = data['age'].mean()
-        insights.append(f"📊 **Demographics**: Average patient age is {avg_age:.1f} years")
+        insights.append(f"📊 **Demographics**: Average patient age is {metrics['avg_age']:.1f} years")
     
     # Medical condition insights
     if condition_col:
-        top_condition = data[condition_col].value_counts().index[0]
-        top_condition_pct = data[condition_col].value_counts(normalize=True).iloc[0] * 100
+        condition_counts = value_counts(data_key, condition_col, data[condition_col])
+        top_condition = condition_counts.index[0]
+        top_condition_pct = condition_counts.iloc[0] / condition_counts.sum() * 100
         insights.append(f"🏥 **Most Common Condition**: {top_condition} ({top_condition_pct:.1f}% of patients)")
     
     # Financial insights
     if billing_col:
-        avg_billing = data[billing_col].mean()
+        avg_billing = metrics['avg_billing']
         high_billing_threshold = data[billing_col].quantile(0.9)
         high_billing_pct = (data[billing_col] > high_billing_threshold).mean() * 100
         insights.append(f"💰 **Financial**: Average billing is ${avg_billing:,.0f}, with {high_billing_pct:.1f}% of cases being high-cost")
     
     # Target variable insights
     if target_col:
-        abnormal_pct = (data[target_col] == 'Abnormal').mean() * 100
         insights.append(f"🎯 **Test Results**: {abnormal_pct:.1f}% of patients have abnormal test results")
     
     # Display insights
@@ -670,9 +862,9 @@ if st.button("Generate Analysis Report"):
     
     # Generate summary statistics
     total_patients = len(data)
-    avg_age = data['age'].mean() if 'age' in data.columns else 0
-    top_condition = data[condition_col].value_counts().index[0] if condition_col else 'N/A'
-    abnormal_rate = (data[target_col] == 'Abnormal').mean() * 100 if target_col else 0
+    avg_age = metrics['avg_age'] if metrics['avg_age'] is not None else 0
+    top_condition = value_counts(data_key, condition_col, data[condition_col]).index[0] if condition_col else 'N/A'
+    abnormal_rate = abnormal_pct if target_col else 0
     
     # Find date range
     date_range = "N/A"
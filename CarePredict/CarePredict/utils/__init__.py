@@ -0,0 +1 @@
+"""Shared helpers for the healthcare analytics pages."""
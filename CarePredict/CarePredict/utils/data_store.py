@@ -0,0 +1,54 @@
+"""Access to the uploaded dataset shared between pages."""
+import uuid
+import streamlit as st
+
+
+def read_dataset(columns=None):
+    """Return a private copy of the uploaded dataset, optionally limited to ``columns``.
+    
+    The copy is a shallow copy of the frame held in session state; with the
+    copy-on-write mode app.py enables, no column buffers are duplicated until
+    a page modifies them.
+    """
+    data = st.session_state['healthcare_data']
+    if columns is not None:
+        data = data[columns]
+    return data.copy(deep=False)
+
+
+def dataset_key():
+    """Identifier of the uploaded dataset (content hash and column selection).
+    
+    Pages pass it to cached helpers alongside an underscore-prefixed frame so
+    Streamlit keys the cache on the upload rather than hashing the data.
+    """
+    return st.session_state.get('healthcare_data_key')
+
+
+def store_processed(data, treatment=True):
+    """Store the preprocessing page's frame for the later pages.
+    
+    Each stored treatment gets a new version number for processed_key(). The
+    untreated frame the page rebuilds on every rerun is stored with version 0,
+    so storing it again does not invalidate anything.
+    """
+    version = 0
+    if treatment:
+        version = st.session_state.get('healthcare_data_treatments', 0) + 1
+        st.session_state['healthcare_data_treatments'] = version
+    st.session_state['healthcare_data_processed'] = data
+    st.session_state['healthcare_data_processed_version'] = version
+
+
+def processed_key():
+    """Identifier of the frame last stored with store_processed().
+    
+    Version 0 is fully determined by the upload, so sessions share its cached
+    results; treated frames also carry the session's id, since treatment
+    counters are per session while the caches are process-wide.
+    """
+    version = st.session_state.get('healthcare_data_processed_version', 0)
+    if version == 0:
+        return (dataset_key(), 0)
+    session_id = st.session_state.setdefault('_session_id', uuid.uuid4().hex)
+    return (dataset_key(), session_id, version)
@@ -0,0 +1,101 @@
+"""Compiled numeric kernels for per-row feature calculations.
+
+Numba is optional and not a declared dependency. Without it, group_rate
+and bucket_index are replaced by equivalent vectorized NumPy versions;
+length_of_stay runs as a plain Python loop with the same results, but
+roughly 10-20x slower than vectorized pandas.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; fall back to interpreted kernels
+    HAVE_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+NANOSECONDS_PER_DAY = 86_400_000_000_000
+NAT = np.iinfo(np.int64).min
+
+
+@njit(cache=True)
+def length_of_stay(admission_ns, discharge_ns, out):
+    """Fill ``out`` with whole days between admission and discharge.
+    
+    Inputs are datetime64[ns] values viewed as int64; rows where either
+    date is NaT are set to NaN, so ``out`` must be a float array.
+    """
+    for i in range(admission_ns.shape[0]):
+        if admission_ns[i] == NAT or discharge_ns[i] == NAT:
+            out[i] = np.nan
+        else:
+            out[i] = (discharge_ns[i] - admission_ns[i]) // NANOSECONDS_PER_DAY
+
+
+@njit(cache=True)
+def bucket_index(values, edges, out):
+    """Fill ``out`` with the index of the right-closed bin each value falls in.
+    
+    Matches ``pd.cut(values, edges)`` codes: bin ``i`` covers
+    ``(edges[i], edges[i + 1]]`` and values outside every bin (or NaN) get -1.
+    Used for the visualization page's age groups.
+    """
+    n_bins = edges.shape[0] - 1
+    for i in range(values.shape[0]):
+        value = values[i]
+        out[i] = -1
+        if value > edges[0] and value <= edges[n_bins]:
+            lo = 0
+            hi = n_bins
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if value > edges[mid]:
+                    lo = mid
+                else:
+                    hi = mid
+            out[i] = lo
+
+
+@njit(cache=True)
+def group_rate(codes, flags, out):
+    """Fill ``out`` with the percentage of rows with ``flags`` set in each group.
+    
+    ``codes`` are categorical codes indexing ``out``; rows coded -1 (missing)
+    are skipped and groups without any rows are set to NaN. Used for the
+    abnormal test result rate per condition and age group.
+    """
+    totals = np.zeros(out.shape[0], dtype=np.int64)
+    hits = np.zeros(out.shape[0], dtype=np.int64)
+    for i in range(codes.shape[0]):
+        code = codes[i]
+        if code >= 0:
+            totals[code] += 1
+            if flags[i]:
+                hits[code] += 1
+    for group in range(out.shape[0]):
+        if totals[group] == 0:
+            out[group] = np.nan
+        else:
+            out[group] = hits[group] * 100.0 / totals[group]
+
+
+if not HAVE_NUMBA:
+    # Interpreted per-row loops are far slower than NumPy's vectorized
+    # reductions, so use those instead when the kernels cannot be compiled
+    
+    def group_rate(codes, flags, out):
+        """Vectorized group_rate: bincounts of the codes, plain and weighted by ``flags``."""
+        present = codes >= 0
+        totals = np.bincount(codes[present], minlength=out.shape[0])
+        hits = np.bincount(codes[present], weights=flags[present].astype(np.float64), minlength=out.shape[0])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            out[:] = np.where(totals > 0, hits * 100.0 / totals, np.nan)
+    
+    def bucket_index(values, edges, out):
+        """Vectorized bucket_index: a left-sided searchsorted, with out-of-range values set to -1."""
+        inside = (values > edges[0]) & (values <= edges[-1])
+        out[:] = np.where(inside, np.searchsorted(edges, values, side='left') - 1, -1)
@@ -0,0 +1,32 @@
+"""Lightweight HTML rendering for small, static tables."""
+import streamlit as st
+
+TABLE_CSS = """
+<style>
+    .static-table {
+        width: 100%;
+        border-collapse: collapse;
+        font-size: 0.9rem;
+        margin-bottom: 1rem;
+    }
+    .static-table th {
+        background-color: #f0f2f6;
+        text-align: left;
+    }
+    .static-table th, .static-table td {
+        padding: 0.4rem 0.75rem;
+        border-bottom: 1px solid #e6e9ef;
+    }
+</style>
+"""
+
+
+@st.cache_data(show_spinner=False)
+def table_html(df):
+    """Render a DataFrame to an HTML table once per distinct content."""
+    return df.to_html(index=False, border=0, classes='static-table')
+
+
+def render_table(df):
+    """Show a small table as static HTML instead of the interactive grid component."""
+    st.markdown(TABLE_CSS + table_html(df), unsafe_allow_html=True)